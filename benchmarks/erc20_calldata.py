@@ -0,0 +1,60 @@
+"""ERC-20 calldata encoded per second: web3 contract functions against core.contracts.erc20.
+
+No RPC request is sent. Run from the repository root:
+    python -m benchmarks.erc20_calldata --iterations 20000
+"""
+import argparse
+import time
+
+from core.contracts import abi_registry, erc20
+from core.rpc import get_provider
+
+TOKEN = "0x4200000000000000000000000000000000000006"
+OWNER = "0x000000000000000000000000000000000000dEaD"
+SPENDER = "0x1111111254EEB25477B68fb85Ed929f73A960582"
+AMOUNT = 10 ** 18
+
+
+def measure(label: str, encode, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        encode()
+    rate = iterations / (time.perf_counter() - started)
+    print(f"{label:>28} | {rate:>12.0f} calls/s")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    functions = abi_registry.contract(get_provider("http://127.0.0.1:8545"), TOKEN).functions
+    cases = {
+        "balanceOf": (
+            lambda: functions.balanceOf(OWNER)._encode_transaction_data(),
+            lambda: erc20.balance_of(OWNER),
+        ),
+        "allowance": (
+            lambda: functions.allowance(OWNER, SPENDER)._encode_transaction_data(),
+            lambda: erc20.allowance(OWNER, SPENDER),
+        ),
+        "approve": (
+            lambda: functions.approve(SPENDER, AMOUNT)._encode_transaction_data(),
+            lambda: erc20.approve(SPENDER, AMOUNT),
+        ),
+        "transfer": (
+            lambda: functions.transfer(SPENDER, AMOUNT)._encode_transaction_data(),
+            lambda: erc20.transfer(SPENDER, AMOUNT),
+        ),
+    }
+
+    for name, (web3_path, fast_path) in cases.items():
+        assert web3_path() == fast_path(), f"{name} calldata mismatch"
+        web3_rate = measure(f"{name} (web3 contract)", web3_path, args.iterations)
+        fast_rate = measure(f"{name} (erc20 encoder)", fast_path, args.iterations)
+        print(f"{'speedup':>28} | {fast_rate / web3_rate:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Accounts derived per second by KeypairCache.warm against worker count.
+
+Run from the repository root:
+    python -m benchmarks.key_derivation --accounts 2000
+"""
+import argparse
+import os
+import time
+
+from eth_account import Account as EthAccount
+
+from utils.keypairs import KeypairCache
+
+EthAccount.enable_unaudited_hdwallet_features()
+
+
+def generate_mnemonics(count: int) -> list[str]:
+    return [EthAccount.create_with_mnemonic()[1] for _ in range(count)]
+
+
+def measure(mnemonics: list[str], workers: int) -> float:
+    cache = KeypairCache()
+    started = time.perf_counter()
+    cache.warm(mnemonics, workers=workers)
+    return len(mnemonics) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--accounts", type=int, default=1000)
+    args = parser.parse_args()
+
+    mnemonics = generate_mnemonics(args.accounts)
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, cpu_count} & set(range(1, cpu_count + 1)))
+
+    print(f"{'workers':>8} | {'accounts/s':>12}")
+    for workers in worker_counts:
+        print(f"{workers:>8} | {measure(mnemonics, workers):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
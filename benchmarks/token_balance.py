@@ -0,0 +1,51 @@
+"""Per-call overhead of preparing a ``token_balance`` call, before and after the ABI registry.
+
+Measures only the client side (contract construction and calldata encoding),
+no RPC request is sent. Run from the repository root:
+    python -m benchmarks.token_balance --iterations 2000
+"""
+import argparse
+import time
+from pathlib import Path
+
+from web3 import AsyncWeb3
+from web3.eth import AsyncEth
+
+from core.contracts import abi_registry
+from core.rpc import get_provider
+
+TOKEN = "0x4200000000000000000000000000000000000006"
+HOLDER = "0x000000000000000000000000000000000000dEaD"
+
+
+def measure(label: str, prepare, iterations: int) -> None:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        prepare()
+    elapsed = time.perf_counter() - started
+    print(f"{label:>22} | {elapsed / iterations * 1e6:>9.1f} µs/call | {iterations / elapsed:>10.0f} calls/s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    provider = get_provider("http://127.0.0.1:8545")
+    w3 = AsyncWeb3(provider, modules={"eth": (AsyncEth,)})
+    raw_abi = Path("./abi/erc_20.json").read_text(encoding="utf-8")
+
+    def before():
+        contract = w3.eth.contract(address=AsyncWeb3.to_checksum_address(TOKEN), abi=raw_abi)
+        return contract.functions.balanceOf(HOLDER)._encode_transaction_data()
+
+    def after():
+        contract = abi_registry.contract(provider, TOKEN)
+        return contract.functions.balanceOf(HOLDER)._encode_transaction_data()
+
+    measure("raw ABI per call", before, args.iterations)
+    measure("ABI registry", after, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,7 @@ class Console:
         "💰 Faucet",
         "💸 Transfer STT",
         "👥 Socials quests 1",
+        "💼 Portfolio scan",
         "🚪 Exit",
     )
     MODULES_DATA = {
@@ -31,6 +32,7 @@ class Console:
         "💰 Faucet": "faucet",
         "💸 Transfer STT": "transfer_stt",
         "👥 Socials quests 1": "socials_quests_1",
+        "💼 Portfolio scan": "portfolio_scan",
         "🚪 Exit": "exit"
     }
 
@@ -8,6 +8,7 @@ from better_proxy import Proxy
 from curl_cffi.requests import AsyncSession
 
 from core.exceptions.base import APIError, SessionRateLimited, ServerError
+from utils import AsyncClosable
 
 @dataclass
 class ChromeVersion:
@@ -47,7 +48,9 @@ class BrowserProfile:
         weights = [v.weight for v in versions]
         return random.choices(versions, weights=weights, k=1)[0]
 
-class BaseAPIClient:
+class BaseAPIClient(AsyncClosable):
+    open_sessions = 0
+
     def __init__(self, 
                  base_url: str, 
                  proxy: Optional[Proxy] = None,
@@ -91,8 +94,18 @@ class BaseAPIClient:
             }
 
         self.session_start_time = time.time()
+        BaseAPIClient.open_sessions += 1
         return session
 
+    async def _close_session(self) -> None:
+        if self.session is not None:
+            session, self.session = self.session, None
+            BaseAPIClient.open_sessions -= 1
+            await session.close()
+
+    async def close(self) -> None:
+        await self._close_session()
+
     async def _manage_cookies(self, response):
         if response.cookies:
             if random.random() < 0.1:
@@ -115,8 +128,8 @@ class BaseAPIClient:
     async def _maybe_rotate_session(self):
         self.requests_count += 1
         actual_lifetime = self.session_lifetime * random.uniform(0.8, 1.2)
-        if self.requests_count >= actual_lifetime:
-            await self.session.close()
+        if self.session is None or self.requests_count >= actual_lifetime:
+            await self._close_session()
             self.session = self._create_session()
             self.requests_count = 0
 
@@ -1,18 +1,24 @@
 
-from core.wallet import Wallet
+from core.signer import Signer
 from core.api import BaseAPIClient
+from core.exceptions.base import APIError
+from core.auth import auth_tokens
 from models import Account
 from loguru import logger
-from utils import random_sleep
+from utils import AsyncClosable, random_sleep
 
-class SomniaWorker:
-    def __init__(self, account: Account):
+class SomniaWorker(AsyncClosable):
+    def __init__(self, account: Account, api: BaseAPIClient | None = None):
         self.account = account
-        self.wallet = Wallet(account.pk_or_mnemonic, account.proxy)
-        self.api = BaseAPIClient(base_url="https://quest.somnia.network/api", proxy=account.proxy)
-        self.authorization_token = None
+        self.wallet = Signer(account.pk_or_mnemonic)
+        self._owns_api = api is None
+        self.api = api or BaseAPIClient(base_url="https://quest.somnia.network/api", proxy=account.proxy)
         self.base_headers = None
 
+    async def close(self) -> None:
+        if self._owns_api:
+            await self.api.close()
+
     @property
     def wallet_address(self):
         return self.wallet.wallet_address
@@ -20,52 +26,65 @@ class SomniaWorker:
     async def get_signature(self, *args, **kwargs):
         return await self.wallet.get_signature(*args, **kwargs)
 
+    @property
+    def authorization_token(self) -> str | None:
+        return auth_tokens.get(self.wallet_address)
+
     async def send_request(self, *args, **kwargs):
-        return await self.api.send_request(*args, **kwargs)
-        
+        response = await self.api.send_request(*args, **kwargs)
+        headers = kwargs.get("headers") or {}
+        if response.status_code == 401 and headers.get("authorization") == f"Bearer {self.authorization_token}":
+            auth_tokens.invalidate(self.wallet_address)
+        return response
+
+    async def _login(self) -> str | None:
+        signature = await self.get_signature('{"onboardingUrl":"https://quest.somnia.network"}')
+
+        headers = {
+            'authority': 'quest.somnia.network',
+            'accept': 'application/json',
+            'content-type': 'application/json',
+            'dnt': '1',
+            'origin': 'https://quest.somnia.network',
+            'referer': 'https://quest.somnia.network/connect?redirect=%2F',
+            'sec-fetch-dest': 'empty',
+            'sec-fetch-mode': 'cors',
+            'sec-fetch-site': 'same-origin'
+        }
+
+        json_data = {
+            'signature': signature,
+            'walletAddress': self.wallet_address,
+        }
+
+        response = await self.send_request(
+            request_type="POST", 
+            method="/auth/onboard", 
+            json_data=json_data, 
+            headers=headers
+        )
+
+        if response.status_code not in [200, 201]:
+            logger.error(f"Account {self.wallet_address} | Onboarding failed with status code: {response.status_code}")
+            return None
+
+        token = response.json().get("token")
+        if not token:
+            logger.error(f"Account {self.wallet_address} | No token in onboarding response")
+            return None
+
+        return token
+
     async def onboarding(self) -> bool:
         try:
-            signature = await self.get_signature('{"onboardingUrl":"https://quest.somnia.network"}')
-            
-            headers = {
-                'authority': 'quest.somnia.network',
-                'accept': 'application/json',
-                'content-type': 'application/json',
-                'dnt': '1',
-                'origin': 'https://quest.somnia.network',
-                'referer': 'https://quest.somnia.network/connect?redirect=%2F',
-                'sec-fetch-dest': 'empty',
-                'sec-fetch-mode': 'cors',
-                'sec-fetch-site': 'same-origin'
-            }
-            
-            json_data = {
-                'signature': signature,
-                'walletAddress': self.wallet_address,
-            }
-            
-            response = await self.send_request(
-                request_type="POST", 
-                method="/auth/onboard", 
-                json_data=json_data, 
-                headers=headers
-            )
-            
-            if response.status_code not in [200, 201]:
-                logger.error(f"Account {self.wallet_address} | Onboarding failed with status code: {response.status_code}")
-                return False
-                
-            response_data = response.json()
-            
-            if not response_data.get("token"):
-                logger.error(f"Account {self.wallet_address} | No token in onboarding response")
+            token = await auth_tokens.token(self.wallet_address, self._login)
+            if token is None:
                 return False
-                
-            self.authorization_token = response_data["token"]
+
             self.base_headers = {
                 'authority': 'quest.somnia.network',
                 'accept': 'application/json',
-                'authorization': f'Bearer {self.authorization_token}',
+                'authorization': f'Bearer {token}',
                 'content-type': 'application/json',
                 'dnt': '1',
                 'referer': 'https://quest.somnia.network/',
@@ -99,9 +118,14 @@ class SomniaWorker:
             f"{'='*50}"
         )
 
-    async def get_me_info(self, get_referral_code: bool = False):
+    async def get_me(self) -> dict:
         response = await self.send_request(request_type="GET", method="/users/me", headers=self.base_headers)
-        response = response.json()
+        if response.status_code != 200:
+            raise APIError(f"Failed to get the user info, status code: {response.status_code}")
+        return response.json()
+
+    async def get_me_info(self, get_referral_code: bool = False):
+        response = await self.get_me()
         
         if get_referral_code:
             return response.get("referralCode")
@@ -117,7 +141,7 @@ class SomniaWorker:
    
         return null_fields
     
-    async def activate_referral(self):
+    async def activate_referral(self) -> bool:
         logger.info(f"Account {self.wallet_address} | Activating your account")
         success = False
         
@@ -141,4 +165,6 @@ class SomniaWorker:
                 break
         
         if not success:
-            logger.warning(f"Account {self.wallet_address} | Failed to activate account after 3 attempts. Please try again later")
\ No newline at end of file
+            logger.warning(f"Account {self.wallet_address} | Failed to activate account after 3 attempts. Please try again later")
+
+        return success
\ No newline at end of file
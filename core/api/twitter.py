@@ -1,17 +1,28 @@
+import inspect
+
 from Jam_Twitter_API.account_sync import TwitterAccountSync
 from Jam_Twitter_API.errors import *
 
-from core.wallet import Wallet
+from core.signer import Signer
 from models import Account
 from loguru import logger
+from utils import AsyncClosable
 
 
-class TwitterWorker(Wallet):
+class TwitterWorker(Signer, AsyncClosable):
     def __init__(self, account: Account):
-        Wallet.__init__(self, account.pk_or_mnemonic, account.proxy)
+        Signer.__init__(self, account.pk_or_mnemonic)
         self.account = account
         self.twitter_client = None
 
+    async def close(self) -> None:
+        session = getattr(self.twitter_client, "session", None)
+        if session is not None and hasattr(session, "close"):
+            result = session.close()
+            if inspect.isawaitable(result):
+                await result
+        self.twitter_client = None
+
     async def get_account(self):
         try:
             self.twitter_client = TwitterAccountSync.run(
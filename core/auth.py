@@ -0,0 +1,75 @@
+import base64
+import json
+import time
+from typing import Awaitable, Callable
+
+from utils import JsonCache, SingleFlight
+
+
+def jwt_expiry(token: str) -> float | None:
+    """``exp`` claim of a JWT (unverified), or None if the token is not a readable JWT."""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class AuthTokenCache(JsonCache):
+    """Quest platform bearer tokens per wallet, shared by every worker in the process.
+
+    Tokens live until the ``exp`` claim of the JWT (``default_ttl`` when it
+    cannot be read), minus ``margin`` seconds so a request never starts with
+    a token about to expire. Concurrent logins of one wallet share a single
+    request. With ``load`` tokens are also kept on disk between runs.
+    """
+    NAME = "Auth token cache"
+
+    def __init__(self, default_ttl: float = 3600, margin: float = 60):
+        super().__init__()
+        self.default_ttl = default_ttl
+        self.margin = margin
+        self._tokens: dict[str, tuple[str, float]] = {}
+        self._logins = SingleFlight()
+
+    def _dump(self) -> dict[str, tuple[str, float]]:
+        return self._tokens
+
+    def _restore(self, data: dict) -> None:
+        now = time.time()
+        self._tokens = {
+            address: (token, expires_at)
+            for address, (token, expires_at) in data.items()
+            if expires_at > now
+        }
+
+    def get(self, address: str) -> str | None:
+        entry = self._tokens.get(address.lower())
+        if entry is None or entry[1] - self.margin <= time.time():
+            return None
+        return entry[0]
+
+    def put(self, address: str, token: str) -> None:
+        expires_at = jwt_expiry(token) or time.time() + self.default_ttl
+        self._tokens[address.lower()] = (token, expires_at)
+        self._touch()
+
+    def invalidate(self, address: str) -> None:
+        if self._tokens.pop(address.lower(), None) is not None:
+            self._touch()
+
+    async def token(self, address: str, login: Callable[[], Awaitable[str | None]]) -> str | None:
+        token = self.get(address)
+        if token is not None:
+            return token
+        return await self._logins.run(address.lower(), lambda: self._login(address, login))
+
+    async def _login(self, address: str, login: Callable[[], Awaitable[str | None]]) -> str | None:
+        token = await login()
+        if token is not None:
+            self.put(address, token)
+        return token
+
+
+auth_tokens = AuthTokenCache()
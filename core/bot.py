@@ -2,7 +2,7 @@ import asyncio
 import random
 
 from core.modules import *
-from loader import config
+from loader import config, state
 from models import Account
 from loguru import logger
 from utils import show_trx_log
@@ -10,32 +10,43 @@ from utils import show_trx_log
 class SomniaBot:
     @staticmethod
     async def process_account_statistics(account: Account) -> tuple[bool, str]:
-        module = ProfileModule(account, config.referral_code)
-        result = await module.get_account_statistics()
+        async with ProfileModule(account, config.referral_code) as module:
+            result = await module.get_account_statistics()
         if result:
             return True, "Account statistics completed successfully"
         return False, "Account statistics failed"
     
     @staticmethod
     async def process_profile(account: Account) -> tuple[bool, str]:
-        module = ProfileModule(account, config.referral_code)
-        result = await module.run()
+        if config.resume and ProfileModule.is_completed(account):
+            logger.info(f"Account {account.address} | Profile is already set up, skipping")
+            return True, "Profile already completed"
+
+        async with ProfileModule(account, config.referral_code) as module:
+            result = await module.run()
         if result:
             return True, "Profile completed successfully"
         return False, "Profile failed"
     
     @staticmethod
     async def process_faucet(account: Account) -> tuple[bool, str]:
-        module = FaucetModule(account)
-        result = await module.faucet()
+        if config.resume and state.is_done(account.address, FaucetModule.MODULE, ttl=FaucetModule.CLAIM_INTERVAL):
+            logger.info(f"Account {account.address} | Faucet was claimed less than 24 hours ago, skipping")
+            return True, "Faucet already claimed"
+
+        async with FaucetModule(account) as module:
+            result = await module.faucet()
         if result:
             return True, "Faucet completed successfully"
         return False, "Faucet failed"
     
     @staticmethod
     async def process_transfer_stt(account: Account) -> tuple[bool, str]:
-        module = TransferSTTModule(account, config.somnia_rpc)
-        result = await module.transfer_stt()
+        async with TransferSTTModule(account, config.somnia_rpc) as module:
+            if config.transfer_stt.batch_size > 1:
+                return await module.transfer_stt_batch(config.transfer_stt)
+
+            result = await module.transfer_stt()
         show_trx_log(module.wallet_address, f"Transfer STT", result[0], result[1])
         if result:
             return True, "Transfer STT completed successfully"
@@ -43,8 +54,20 @@ class SomniaBot:
     
     @staticmethod
     async def process_socials_quests_1(account: Account) -> tuple[bool, str]:
-        module = SocialsQuest1Module(account)
-        result = await module.run()
+        if config.resume and state.is_done(account.address, SocialsQuest1Module.MODULE):
+            logger.info(f"Account {account.address} | Socials quests 1 are already completed, skipping")
+            return True, "Socials quests 1 already completed"
+
+        async with SocialsQuest1Module(account) as module:
+            result = await module.run()
         if result:
             return True, "Socials quests 1 completed successfully"
-        return False, "Socials quests 1 failed"
\ No newline at end of file
+        return False, "Socials quests 1 failed"
+
+    @staticmethod
+    async def process_portfolio_scan(accounts: list[Account]) -> tuple[bool, str]:
+        scanner = PortfolioScanner(config.somnia_rpc, config.tokens)
+        rows = await scanner.scan([account.address for account in accounts])
+        csv_path, json_path = scanner.export(rows)
+        logger.success(f"Portfolio scan | {len(rows)} wallets saved to {csv_path} and {json_path}")
+        return True, "Portfolio scan completed successfully"
\ No newline at end of file
@@ -0,0 +1,3 @@
+from . import erc20
+from .abi import AbiRegistry, abi_registry
+from .tokens import NATIVE_TOKEN_ADDRESSES, TokenMetadata, TokenRegistry, checksum, token_registry
@@ -0,0 +1,85 @@
+import json
+from pathlib import Path
+
+from eth_utils import function_abi_to_4byte_selector, to_checksum_address
+from web3 import AsyncWeb3
+from web3.contract import AsyncContract
+from web3.eth import AsyncEth
+
+from models import ERC20_ABI
+
+
+class AbiRegistry:
+    """Parsed ABIs and ready-to-use contract objects.
+
+    Every ABI file under ``directory`` is read and parsed once. Contract
+    objects are cached per (provider, address, ABI) and bound to one
+    ``AsyncWeb3`` per provider, so all wallets sharing a provider reuse them
+    instead of rebuilding web3's function tables on every call.
+    """
+
+    def __init__(self, directory: Path | str = "./abi"):
+        self.directory = Path(directory)
+        self._abis: dict[str, list] = {}
+        self._selectors: dict[str, dict[str, str]] = {}
+        self._web3: dict[int, AsyncWeb3] = {}
+        self._contracts: dict[tuple[int, str, str], AsyncContract] = {}
+        # id(abi) -> (abi, cache key); the ABI is held so its id cannot be reused
+        self._abi_keys: dict[int, tuple[list, str]] = {}
+
+    def register(self, name: str, abi: list) -> None:
+        self._abis[name] = abi
+        self._abi_keys[id(abi)] = (abi, name)
+
+    def abi(self, name: str) -> list:
+        abi = self._abis.get(name)
+        if abi is None:
+            abi = json.loads((self.directory / f"{name}.json").read_text(encoding="utf-8"))
+            self.register(name, abi)
+        return abi
+
+    def selectors(self, name: str) -> dict[str, str]:
+        selectors = self._selectors.get(name)
+        if selectors is None:
+            selectors = {
+                entry["name"]: "0x" + function_abi_to_4byte_selector(entry).hex()
+                for entry in self.abi(name)
+                if entry.get("type") == "function"
+            }
+            self._selectors[name] = selectors
+        return selectors
+
+    def _web3_for(self, provider) -> AsyncWeb3:
+        w3 = self._web3.get(id(provider))
+        if w3 is None:
+            w3 = AsyncWeb3(provider, modules={"eth": (AsyncEth,)})
+            self._web3[id(provider)] = w3
+        return w3
+
+    def _cached_contract(self, provider, address: str, key: str, abi: list | str) -> AsyncContract:
+        address = to_checksum_address(address)
+        cache_key = (id(provider), address, key)
+        contract = self._contracts.get(cache_key)
+        if contract is None:
+            contract = self._web3_for(provider).eth.contract(address=address, abi=abi)
+            self._contracts[cache_key] = contract
+        return contract
+
+    def contract(self, provider, address: str, name: str = "erc_20") -> AsyncContract:
+        return self._cached_contract(provider, address, name, self.abi(name))
+
+    def _abi_key(self, abi: list) -> str:
+        """Registered name of ``abi``, or its serialized form computed the first time the object is seen."""
+        entry = self._abi_keys.get(id(abi))
+        if entry is None:
+            entry = (abi, json.dumps(abi, sort_keys=True))
+            self._abi_keys[id(abi)] = entry
+        return entry[1]
+
+    def contract_for_abi(self, provider, address: str, abi: list | str) -> AsyncContract:
+        key = abi if isinstance(abi, str) else self._abi_key(abi)
+        return self._cached_contract(provider, address, key, abi)
+
+
+abi_registry = AbiRegistry()
+abi_registry.register("erc_20", ERC20_ABI)
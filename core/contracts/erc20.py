@@ -0,0 +1,59 @@
+"""Hand-rolled calldata for the few ERC-20 calls on the hot path.
+
+Every argument is a static 32-byte word, so calldata is the selector followed
+by hex-padded words; this skips web3's ABI lookup, argument normalisation and
+codec dispatch. Selectors match ``abi_registry.selectors("erc_20")``.
+"""
+from eth_utils import to_int
+
+BALANCE_OF_SELECTOR = "0x70a08231"
+ALLOWANCE_SELECTOR = "0xdd62ed3e"
+APPROVE_SELECTOR = "0x095ea7b3"
+TRANSFER_SELECTOR = "0xa9059cbb"
+DECIMALS_SELECTOR = "0x313ce567"
+
+_MAX_UINT256 = 2 ** 256 - 1
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+def _address_word(address: str) -> str:
+    if len(address) != 42 or not address.startswith(("0x", "0X")) or not _HEX_DIGITS.issuperset(address[2:]):
+        raise ValueError(f"Invalid address: {address!r}")
+    return "000000000000000000000000" + address[2:].lower()
+
+
+def _uint_word(value: int) -> str:
+    if not 0 <= value <= _MAX_UINT256:
+        raise ValueError(f"Value out of uint256 range: {value}")
+    return format(value, "064x")
+
+
+def balance_of(owner: str) -> str:
+    return BALANCE_OF_SELECTOR + _address_word(owner)
+
+
+def allowance(owner: str, spender: str) -> str:
+    return ALLOWANCE_SELECTOR + _address_word(owner) + _address_word(spender)
+
+
+def approve(spender: str, amount: int) -> str:
+    return APPROVE_SELECTOR + _address_word(spender) + _uint_word(amount)
+
+
+def transfer(recipient: str, amount: int) -> str:
+    return TRANSFER_SELECTOR + _address_word(recipient) + _uint_word(amount)
+
+
+def decimals() -> str:
+    return DECIMALS_SELECTOR
+
+
+def decode_uint(result: str) -> int:
+    """First return word of an ``eth_call``; an empty result means no contract answered."""
+    if len(result) < 66:
+        raise ValueError(f"Could not decode uint256 from eth_call result {result!r}")
+    return to_int(hexstr=result[:66])
+
+
+def call_params(token_address: str, data: str, block: str = "latest") -> list:
+    return [{"to": token_address, "data": data}, block]
@@ -0,0 +1,107 @@
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+
+from eth_utils import to_checksum_address
+from loguru import logger
+
+from core.rpc import RPCBatch
+from models import Token
+from utils import JsonCache, SingleFlight
+from .erc20 import DECIMALS_SELECTOR, decode_uint
+
+
+@lru_cache(maxsize=4096)
+def checksum(address: str) -> str:
+    return to_checksum_address(address)
+
+
+NATIVE_TOKEN_ADDRESSES = frozenset({
+    checksum("0x0000000000000000000000000000000000000000"),
+    checksum("0x4200000000000000000000000000000000000006"),
+})
+
+
+@dataclass
+class TokenMetadata:
+    address: str
+    decimals: int
+    symbol: str | None = None
+
+    def __post_init__(self):
+        if not isinstance(self.decimals, int) or isinstance(self.decimals, bool) or not 0 <= self.decimals <= 255:
+            raise ValueError(f"Invalid decimals for token {self.address}: {self.decimals!r}")
+        self.address = checksum(self.address)
+
+
+class TokenRegistry(JsonCache):
+    """Process-wide token metadata, so amount conversions avoid ``decimals()`` calls.
+
+    Symbols come from ``Config.tokens``; decimals are fetched once per token
+    (concurrent lookups share one request) and persisted to disk.
+    """
+    NAME = "Token metadata"
+    INDENT = 2
+
+    def __init__(self):
+        super().__init__()
+        self._tokens: dict[str, TokenMetadata] = {}
+        self._symbols: dict[str, str] = {}
+        self._fetches = SingleFlight()
+
+    @staticmethod
+    def is_native(address: str) -> bool:
+        return checksum(address) in NATIVE_TOKEN_ADDRESSES
+
+    def _dump(self) -> list[dict]:
+        return [asdict(metadata) for metadata in self._tokens.values()]
+
+    def _restore(self, data: list) -> None:
+        if not isinstance(data, list):
+            raise TypeError("expected a list of tokens")
+
+        for entry in data:
+            try:
+                metadata = TokenMetadata(**entry)
+            except (TypeError, ValueError) as error:
+                logger.warning(f"Token metadata {self._path} | Skipping malformed entry {entry!r}: {error}")
+                continue
+            self._tokens[metadata.address] = metadata
+
+    def preload(self, tokens: list[Token]) -> None:
+        for token in tokens:
+            if not token.address:
+                continue
+            address = checksum(token.address)
+            self._symbols[address] = token.name
+            if address in self._tokens and self._tokens[address].symbol is None:
+                self._tokens[address].symbol = token.name
+
+    def get(self, address: str) -> TokenMetadata | None:
+        return self._tokens.get(checksum(address))
+
+    async def decimals(self, address: str, provider) -> int:
+        address = checksum(address)
+        metadata = self._tokens.get(address)
+        if metadata is not None:
+            return metadata.decimals
+
+        return await self._fetches.run(address, lambda: self._fetch(address, provider))
+
+    async def _fetch(self, address: str, provider) -> int:
+        batch = RPCBatch(provider)
+        batch.add("eth_call", [{"to": address, "data": DECIMALS_SELECTOR}, "latest"], formatter=None)
+        (result,) = await batch.execute()
+
+        try:
+            metadata = TokenMetadata(address, decode_uint(result or "0x"), self._symbols.get(address))
+        except ValueError as error:
+            # EOAs and contracts without decimals() answer with an empty result
+            raise ValueError(f"Token {address} is not an ERC-20 contract: {error}") from None
+
+        self._tokens[address] = metadata
+        self._touch()
+        self.save()
+        return metadata.decimals
+
+
+token_registry = TokenRegistry()
@@ -31,3 +31,12 @@ class ServerError(APIError):
     """Raised when the server returns an error"""
 
     pass
+
+
+class RPCError(ValueError):
+    """Raised when a JSON-RPC call returns an error"""
+
+    def __init__(self, method: str, error: dict | str):
+        self.method = method
+        self.error = error
+        super().__init__(f"{method} failed: {error}")
@@ -2,3 +2,4 @@ from .profile import ProfileModule
 from .faucet import FaucetModule
 from .transfer_stt import TransferSTTModule
 from .socials_quests_1 import SocialsQuest1Module
+from .portfolio import PortfolioScanner
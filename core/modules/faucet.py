@@ -1,13 +1,17 @@
 from loguru import logger
 
+from loader import state
 from models import Account
-from core.wallet import Wallet
+from core.signer import Signer
 from core.api import BaseAPIClient
 
 
-class FaucetModule(Wallet, BaseAPIClient):
+class FaucetModule(Signer, BaseAPIClient):
+    MODULE = "faucet"
+    CLAIM_INTERVAL = 24 * 60 * 60
+
     def __init__(self, account: Account):
-        Wallet.__init__(self, account.pk_or_mnemonic, account.proxy)
+        Signer.__init__(self, account.pk_or_mnemonic)
         BaseAPIClient.__init__(self, base_url="https://testnet.somnia.network", proxy=account.proxy)  
         
     async def faucet(self):
@@ -35,10 +39,12 @@ class FaucetModule(Wallet, BaseAPIClient):
         if response.get("error"):
             if response.get("error") == "Please wait 24 hours between requests":
                 logger.warning(f"Account {self.wallet_address} | Tokens have already been received for this wallet today, come back tomorrow")
+                state.mark(self.wallet_address, self.MODULE)
                 return True
             else:
                 logger.error(f"Account {self.wallet_address} | {response.get('error')}")
                 return False
         else:
             logger.success(f"Account {self.wallet_address} | Successfully requested test tokens")
+            state.mark(self.wallet_address, self.MODULE)
             return True
\ No newline at end of file
@@ -0,0 +1,148 @@
+import asyncio
+import csv
+import json
+import time
+from pathlib import Path
+
+from eth_abi import decode, encode
+from eth_utils import to_checksum_address
+from loguru import logger
+
+from core.contracts import token_registry
+from core.rpc import RPCBatch, get_provider
+from core.rpc.batch import hex_to_int
+from models import Token
+
+
+class PortfolioScanner:
+    """Native and ERC-20 balances of many wallets in a handful of RPC calls.
+
+    Each chunk of wallets is read with a single Multicall3 ``aggregate3``
+    eth_call when the contract is deployed, otherwise with one JSON-RPC batch
+    of ``eth_getBalance``/``balanceOf`` calls. Chunks run concurrently.
+    """
+    MULTICALL3 = "0xcA11bde05977b3631167028862bE2a173976CA11"
+    AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")
+    GET_ETH_BALANCE_SELECTOR = bytes.fromhex("4d2301cc")
+    BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")
+
+    def __init__(self, rpc_url: str | list[str], tokens: list[Token], chunk_size: int = 200, concurrency: int = 4):
+        self.provider = get_provider(rpc_url)
+        self.tokens = [token for token in tokens if token.address]
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+
+    async def _has_multicall(self) -> bool:
+        batch = RPCBatch(self.provider)
+        batch.add("eth_getCode", [self.MULTICALL3, "latest"], formatter=None)
+        try:
+            (code,) = await batch.execute()
+        except Exception:
+            return False
+        return code not in (None, "0x", "0x0")
+
+    def _balance_calls(self, address: str) -> list[tuple[str, bytes]]:
+        encoded_address = encode(["address"], [address])
+        calls = [(self.MULTICALL3, self.GET_ETH_BALANCE_SELECTOR + encoded_address)]
+        calls.extend(
+            (to_checksum_address(token.address), self.BALANCE_OF_SELECTOR + encoded_address)
+            for token in self.tokens
+        )
+        return calls
+
+    async def _scan_chunk_multicall(self, addresses: list[str]) -> list[list[int | None]]:
+        calls = [call for address in addresses for call in self._balance_calls(address)]
+        call_data = self.AGGREGATE3_SELECTOR + encode(
+            ["(address,bool,bytes)[]"], [[(target, True, data) for target, data in calls]]
+        )
+
+        batch = RPCBatch(self.provider)
+        batch.add("eth_call", [{"to": self.MULTICALL3, "data": "0x" + call_data.hex()}, "latest"], formatter=None)
+        (result,) = await batch.execute()
+        (results,) = decode(["(bool,bytes)[]"], bytes.fromhex(result[2:]))
+
+        balances = [
+            int.from_bytes(data[:32], "big") if success and len(data) >= 32 else None
+            for success, data in results
+        ]
+        width = 1 + len(self.tokens)
+        return [balances[i:i + width] for i in range(0, len(balances), width)]
+
+    async def _scan_chunk_batch(self, addresses: list[str]) -> list[list[int | None]]:
+        batch = RPCBatch(self.provider)
+        for address in addresses:
+            batch.add("eth_getBalance", [address, "latest"], formatter=None)
+            for target, data in self._balance_calls(address)[1:]:
+                batch.add("eth_call", [{"to": target, "data": "0x" + data.hex()}, "latest"], formatter=None)
+
+        balances = [
+            hex_to_int(result) if result not in (None, "0x") else None
+            for result in await batch.execute(raise_on_error=False)
+        ]
+        width = 1 + len(self.tokens)
+        return [balances[i:i + width] for i in range(0, len(balances), width)]
+
+    async def _resolve_decimals(self) -> list[int]:
+        """Decimals of the configured tokens; tokens that are not ERC-20 contracts are dropped from the scan."""
+        results = await asyncio.gather(
+            *(token_registry.decimals(token.address, self.provider) for token in self.tokens),
+            return_exceptions=True,
+        )
+
+        tokens, decimals = [], []
+        for token, result in zip(self.tokens, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Portfolio scan | Skipping token {token.name}: {result}")
+                continue
+            tokens.append(token)
+            decimals.append(result)
+        self.tokens = tokens
+        return decimals
+
+    async def scan(self, addresses: list[str]) -> list[dict]:
+        decimals = await self._resolve_decimals()
+        use_multicall = await self._has_multicall()
+        scan_chunk = self._scan_chunk_multicall if use_multicall else self._scan_chunk_batch
+        logger.info(
+            f"Portfolio scan | {len(addresses)} wallets, {len(self.tokens)} tokens via "
+            f"{'Multicall3' if use_multicall else 'JSON-RPC batches'}"
+        )
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run_chunk(chunk: list[str]) -> list[list[int | None]]:
+            async with semaphore:
+                return await scan_chunk(chunk)
+
+        chunks = [addresses[i:i + self.chunk_size] for i in range(0, len(addresses), self.chunk_size)]
+        chunk_results = await asyncio.gather(*(run_chunk(chunk) for chunk in chunks))
+
+        rows = []
+        for chunk, balances in zip(chunks, chunk_results):
+            for address, (native, *token_balances) in zip(chunk, balances):
+                row = {"address": address, "native": self._to_amount(native, 18)}
+                row.update({
+                    token.name: self._to_amount(balance, token_decimals)
+                    for token, token_decimals, balance in zip(self.tokens, decimals, token_balances)
+                })
+                rows.append(row)
+        return rows
+
+    @staticmethod
+    def _to_amount(balance: int | None, decimals: int) -> float | None:
+        return balance / 10 ** decimals if balance is not None else None
+
+    @staticmethod
+    def export(rows: list[dict], directory: Path | str = "./results") -> tuple[Path, Path]:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        stem = directory / f"portfolio_{time.strftime('%Y%m%d_%H%M%S')}"
+        csv_path, json_path = stem.with_suffix(".csv"), stem.with_suffix(".json")
+
+        with csv_path.open("w", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, fieldnames=list(rows[0]) if rows else ["address"])
+            writer.writeheader()
+            writer.writerows(rows)
+
+        json_path.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+        return csv_path, json_path
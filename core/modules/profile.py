@@ -1,19 +1,46 @@
 import asyncio
 import json
+from functools import cached_property
 
 from loguru import logger
+from core.state import Checkpoints
+from loader import config, state
 from models import Account
-from core.api import SomniaWorker, TwitterWorker, DiscordConnectModule
+from core.api import BaseAPIClient, SomniaWorker, TwitterWorker, DiscordConnectModule
 from utils import generate_username, random_sleep
 
 
 class ProfileModule(SomniaWorker):
-    def __init__(self, account: Account, referral_code: str = ""):
-        super().__init__(account)
-        self.twitter_worker = TwitterWorker(account)
-        self.discord_worker = DiscordConnectModule(account)
+    MODULE = "profile"
+    LINKED_FIELDS = {"username": "username", "discordName": "discord", "twitterName": "twitter"}
+
+    def __init__(self, account: Account, referral_code: str = "", api: BaseAPIClient | None = None):
+        super().__init__(account, api)
         self.referral_code = referral_code
 
+    async def close(self) -> None:
+        for worker in ("twitter_worker", "discord_worker"):
+            if worker in self.__dict__:
+                await self.__dict__.pop(worker).close()
+        await super().close()
+
+    @cached_property
+    def twitter_worker(self) -> TwitterWorker:
+        return TwitterWorker(self.account)
+
+    @cached_property
+    def discord_worker(self) -> DiscordConnectModule:
+        return DiscordConnectModule(self.account)
+
+    @classmethod
+    def is_completed(cls, account: Account) -> bool:
+        steps = state.steps(account.address, cls.MODULE)
+        return (
+            "username" in steps
+            and ("discord" in steps or not account.token_discord)
+            and ("twitter" in steps or not account.auth_token)
+        )
+
     async def create_username(self) -> bool:
         logger.info(f"Account {self.wallet_address} | Trying to set the username...")
         while True:
@@ -141,10 +168,10 @@ class ProfileModule(SomniaWorker):
             logger.error(f"Account {self.wallet_address} | Error: {response}")
             return False
 
-    async def referral_bind(self) -> None:
+    async def referral_bind(self) -> bool:
         if not self.referral_code:
             logger.error(f"Account {self.wallet_address} | Referral code not found")
-            return
+            return False
 
         message_to_sign = json.dumps(
             {"referralCode": self.referral_code, "product": "QUEST_PLATFORM"},
@@ -170,14 +197,19 @@ class ProfileModule(SomniaWorker):
             "signature": signature,
         }
 
-        await self.send_request(
+        response = await self.send_request(
             request_type="POST",
             method="/users/referrals",
             json_data=json_data,
             headers=headers,
             verify=False,
         )
-        
+
+        if response.status_code not in [200, 201, 204]:
+            logger.warning(f"Account {self.wallet_address} | Failed to bind the referral code, status code: {response.status_code}")
+            return False
+        return True
+
     async def get_account_statistics(self):
         logger.info(f"Account {self.wallet_address} | Getting account statistics...")
         if not await self.onboarding():
@@ -188,40 +220,55 @@ class ProfileModule(SomniaWorker):
     async def run(self) -> bool:
         try:
             logger.info(f"Account {self.wallet_address} | Starting the profile module...")
-            
+            checkpoints = Checkpoints(state, self.wallet_address, self.MODULE, config.resume)
+
             if not await self.onboarding():
                 logger.error(f"Account {self.wallet_address} | Failed to authorize on Somnia")
                 return False
                             
             logger.info(f"Account {self.wallet_address} | Authorized on the site Somnia")
-            await random_sleep(self.wallet_address, 30, 60)
 
-            await self.referral_bind()
-            logger.info(f"Account {self.wallet_address} | Referral code bound to the account")
-            await random_sleep(self.wallet_address, 60, 120)
-            
-            referral_code = await self.get_me_info(get_referral_code=True)
-            if referral_code is None:
-                await self.activate_referral()
+            if self.referral_code and not checkpoints.done("referral_bind"):
+                await random_sleep(self.wallet_address, 30, 60)
+                if await self.referral_bind():
+                    checkpoints.mark("referral_bind")
+                    logger.info(f"Account {self.wallet_address} | Referral code bound to the account")
+                await random_sleep(self.wallet_address, 60, 120)
+
+            if not checkpoints.done("activation"):
+                referral_code = await self.get_me_info(get_referral_code=True)
+                if referral_code is not None or await self.activate_referral():
+                    checkpoints.mark("activation")
 
-            null_fields = await self.get_me_info()
             logger.info(f"Account {self.wallet_address} | Getting the user info...")
-            await random_sleep(self.wallet_address, 30, 60)
+            user_info = await self.get_me()
+            null_fields = {
+                field: None for field in self.LINKED_FIELDS
+                if field in user_info and user_info[field] is None
+            }
+            for field, step in self.LINKED_FIELDS.items():
+                if user_info.get(field) is not None:
+                    checkpoints.mark(step)
 
-            if any(value is None for value in null_fields.values()):
-                if null_fields.get("username") is None:
+            if null_fields:
+                await random_sleep(self.wallet_address, 30, 60)
+
+                if "username" in null_fields:
                     if not await self.create_username():
                         return False
+                    checkpoints.mark("username")
                     await random_sleep(self.wallet_address, 60, 120)
 
-                if null_fields.get("discordName") is None and self.account.token_discord:
+                if "discordName" in null_fields and self.account.token_discord:
                     if not await self.connect_discord_account():
                         return False
+                    checkpoints.mark("discord")
                     await random_sleep(self.wallet_address, 120, 240)
 
-                if null_fields.get("twitterName") is None and self.account.auth_token:
+                if "twitterName" in null_fields and self.account.auth_token:
                     if not await self.connect_twitter_account():
                         return False
+                    checkpoints.mark("twitter")
             else:
                 await self.get_stats()
                 logger.success(
@@ -232,4 +279,4 @@ class ProfileModule(SomniaWorker):
             
         except Exception as e:
             logger.error(f"Account {self.wallet_address} | Error in run method: {e}")
-            return False
\ No newline at end of file
+            return False
@@ -1,19 +1,28 @@
 import json
 import secrets
+from functools import cached_property
 
 from eth_keys import keys
 from eth_utils import to_checksum_address
 
 from loguru import logger
-from models import Account
+from core.state import Checkpoints
+from loader import config, state
 from core.api import SomniaWorker
 from core.modules import ProfileModule
 
 
 class SocialsQuest1Module(SomniaWorker):
-    def __init__(self, account: Account):
-        super().__init__(account)
-        self.profile_module = ProfileModule(account)
+    MODULE = "socials_quests_1"
+
+    @cached_property
+    def profile_module(self) -> ProfileModule:
+        return ProfileModule(self.account, api=self.api)
+
+    async def close(self) -> None:
+        if "profile_module" in self.__dict__:
+            await self.__dict__.pop("profile_module").close()
+        await super().close()
 
     @staticmethod
     def get_incomplete_quests(response: dict) -> list:
@@ -210,6 +219,7 @@ class SocialsQuest1Module(SomniaWorker):
     async def run(self) -> bool:
         try:
             logger.info(f"Account {self.wallet_address} | Starting the socials quests module...")
+            checkpoints = Checkpoints(state, self.wallet_address, self.MODULE, config.resume)
 
             if not await self.onboarding():
                 logger.error(f"Account {self.wallet_address} | Failed to authorize on Somnia")
@@ -219,17 +229,28 @@ class SocialsQuest1Module(SomniaWorker):
                 logger.info(f"Account {self.wallet_address} | Getting quests...")
                 response = await self.get_quests()
                 response_data = response if isinstance(response, dict) else response.json()
+                if "quests" not in response_data:
+                    logger.error(f"Account {self.wallet_address} | Failed to get quests. Response: {response_data}")
+                    return False
                 incomplete_quests = self.get_incomplete_quests(response_data)
 
-                if "CONNECT_DISCORD" in incomplete_quests:
-                    await self.connect_discord()
-                if "CONNECT_TWITTER" in incomplete_quests:
-                    await self.connect_twitter()
-                if "REFERRAL" in incomplete_quests:
-                    await self.referral()
-                else:
+                if not incomplete_quests:
                     logger.success(f"Account {self.wallet_address} | All quests are completed")
+                    checkpoints.mark(state.COMPLETED)
                     return True
+
+                if "CONNECT_DISCORD" in incomplete_quests and not checkpoints.done("discord"):
+                    if await self.connect_discord():
+                        checkpoints.mark("discord")
+                if "CONNECT_TWITTER" in incomplete_quests and not checkpoints.done("twitter"):
+                    if await self.connect_twitter():
+                        checkpoints.mark("twitter")
+                if "REFERRAL" in incomplete_quests and not checkpoints.done("referral"):
+                    if await self.referral():
+                        checkpoints.mark("referral")
+
+            logger.warning(f"Account {self.wallet_address} | Some quests are still not completed")
+            return False
         except Exception as e:
             logger.error(f"Account {self.wallet_address} | Error in run method: {e}")
             return False
\ No newline at end of file
@@ -6,14 +6,24 @@ from eth_keys import keys
 from eth_utils import to_checksum_address
 
 from loguru import logger
-from models import Account
+from loader import state, throughput
+from models import Account, TransferSTTSettings
 from core.wallet import Wallet
 
 
 class TransferSTTModule(Wallet):
-    def __init__(self, account: Account, rpc_url: str):
+    MODULE = "transfer_stt"
+
+    def __init__(self, account: Account, rpc_url: str | list[str]):
         Wallet.__init__(self, account.pk_or_mnemonic, rpc_url, account.proxy)
         
+    @staticmethod
+    def default_amount(balance: float) -> float | None:
+        if balance > 0.01: return 0.01
+        if balance > 0.005: return 0.005
+        if balance > 0.001: return 0.001
+        return None
+
     @staticmethod
     def generate_eth_address():
         private_key_bytes = secrets.token_bytes(32)
@@ -27,32 +37,92 @@ class TransferSTTModule(Wallet):
         try:
             recipient_address = self.generate_eth_address()
             
-            balance = await self.human_balance()
+            batch = self.batch()
+            batch.add("eth_getBalance", [self.wallet_address, "latest"])
+            (balance_wei,), _ = await asyncio.gather(batch.execute(), self.fee_quote())
+            balance = float(self.from_wei(balance_wei, "ether"))
             
-            if balance > 0.01: amount = 0.01
-            elif balance > 0.005: amount = 0.005
-            elif balance > 0.001: amount = 0.001
-            else:
+            amount = self.default_amount(balance)
+            if amount is None:
                 logger.error(f"Account {self.wallet_address} | Not enough balance")
                 return False, "Not enough balance"
                                   
-            transaction = {
-                "from": self.wallet_address,
-                "to": recipient_address,
-                "value": self.to_wei(amount, "ether"),
-                "nonce": await self.transactions_count(),
-                "gasPrice": await self.eth.gas_price,
-                "gas": 21000
-            }
+            transaction = await self.tx_builder.build(
+                self.wallet_address, recipient_address, value=self.to_wei(amount, "ether")
+            )
             
-            await self.check_trx_availability(transaction)
+            await self.check_trx_availability(transaction, balance_wei)
             
+            throughput.record_submitted()
             status, tx_hash = await self._process_transaction(transaction)
+            throughput.record_result(status)
             
-            if status: return True, tx_hash
+            if status:
+                state.mark(self.wallet_address, self.MODULE, "last_transfer")
+                return True, tx_hash
             else: return False, tx_hash
                 
         except Exception as e:
             logger.error(f"Account {self.wallet_address} | Error in transfer_stt: {str(e)}")
             return False, str(e)
-            
\ No newline at end of file
+
+    def _plan_batch(self, settings: TransferSTTSettings, balance: float) -> list[tuple[str, float]]:
+        transfers = []
+        for _ in range(settings.batch_size):
+            if settings.amount is not None:
+                amount = round(random.uniform(settings.amount.min, settings.amount.max), 6)
+            else:
+                amount = self.default_amount(balance / settings.batch_size)
+                if amount is None:
+                    return []
+            recipient = random.choice(settings.recipients) if settings.recipients else self.generate_eth_address()
+            transfers.append((to_checksum_address(recipient), amount))
+        return transfers
+
+    async def transfer_stt_batch(self, settings: TransferSTTSettings) -> tuple[bool, str]:
+        """Sends ``batch_size`` transfers back to back with consecutive nonces and confirms them together."""
+        logger.info(f"Account {self.wallet_address} | Processing {settings.batch_size} STT transfers...")
+        try:
+            batch = self.batch()
+            batch.add("eth_getBalance", [self.wallet_address, "latest"])
+            (balance_wei,), _ = await asyncio.gather(batch.execute(), self.fee_quote())
+
+            transfers = self._plan_batch(settings, float(self.from_wei(balance_wei, "ether")))
+            if not transfers:
+                logger.error(f"Account {self.wallet_address} | Not enough balance")
+                return False, "Not enough balance"
+
+            transactions = await asyncio.gather(*(
+                self.tx_builder.build(self.wallet_address, recipient, value=self.to_wei(amount, "ether"))
+                for recipient, amount in transfers
+            ))
+            required = sum(
+                trx["value"] + trx["gas"] * trx.get("gasPrice", trx.get("maxFeePerGas", 0))
+                for trx in transactions
+            )
+            if required > balance_wei:
+                raise Exception(
+                    f"ETH balance is not enough for {len(transactions)} transfers. "
+                    f"Required: {self.from_wei(required, 'ether')} ETH | Available: {self.from_wei(balance_wei, 'ether')} ETH"
+                )
+
+            for transaction in transactions:
+                await self.submit_transaction(transaction)
+                throughput.record_submitted()
+
+            results = await self.wait_for_confirmations()
+            for status, _ in results:
+                throughput.record_result(status)
+
+            confirmed = sum(1 for status, _ in results if status)
+            if confirmed:
+                state.mark(self.wallet_address, self.MODULE, "last_transfer")
+            logger.info(f"Account {self.wallet_address} | {confirmed}/{len(results)} STT transfers confirmed")
+            return confirmed == len(results), f"{confirmed}/{len(results)} transfers confirmed"
+
+        except Exception as e:
+            results = await self.wait_for_confirmations()
+            for status, _ in results:
+                throughput.record_result(status)
+            logger.error(f"Account {self.wallet_address} | Error in transfer_stt_batch: {str(e)}")
+            return False, str(e)
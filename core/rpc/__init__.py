@@ -0,0 +1,17 @@
+from .batch import RPCBatch
+from .builder import FeePolicy, GasEstimateCache, TransactionBuilder, tx_builders
+from .gas import FeeQuote, GasOracle, gas_oracles
+from .nonce import NonceManager, is_already_known, is_nonce_error, nonce_managers
+from .receipts import ReceiptTracker, receipt_trackers
+from .pool import EndpointPool, EndpointStats
+from .transport import (
+    MultiEndpointProvider,
+    PooledHTTPProvider,
+    RPCSessionPool,
+    close_transports,
+    endpoint_pools,
+    get_provider,
+    rpc_sessions,
+    use_websocket,
+)
+from .websocket import WebSocketConnection, WebSocketRPCProvider
@@ -0,0 +1,50 @@
+from typing import Any, Callable
+
+from eth_utils import to_int
+
+from core.exceptions.base import RPCError
+
+
+def hex_to_int(value: str) -> int:
+    return to_int(hexstr=value)
+
+
+class RPCBatch:
+    """Independent JSON-RPC reads sent to the node as a single batch request.
+
+    ``add`` queues a call and returns its position; ``execute`` performs one
+    HTTP round trip and returns the formatted results in the same order.
+    With ``raise_on_error`` disabled failed calls yield ``None`` instead.
+    """
+
+    def __init__(self, provider):
+        self.provider = provider
+        self._calls: list[tuple[str, list, Callable[[Any], Any] | None]] = []
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def add(self, method: str, params: list, formatter: Callable[[Any], Any] | None = hex_to_int) -> int:
+        self._calls.append((method, params, formatter))
+        return len(self._calls) - 1
+
+    async def execute(self, raise_on_error: bool = True) -> list[Any]:
+        if not self._calls:
+            return []
+
+        responses = await self.provider.make_batch_request(
+            [(method, params) for method, params, _ in self._calls]
+        )
+
+        results = []
+        for (method, _, formatter), response in zip(self._calls, responses):
+            if "error" in response:
+                if raise_on_error:
+                    raise RPCError(method, response["error"])
+                results.append(None)
+                continue
+            result = response.get("result")
+            results.append(formatter(result) if formatter and result is not None else result)
+
+        self._calls.clear()
+        return results
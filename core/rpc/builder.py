@@ -0,0 +1,201 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Literal
+
+from web3.types import TxParams
+
+from .batch import RPCBatch
+from .gas import FeeQuote, gas_oracles
+
+TRANSFER_GAS = 21_000
+GWEI = 10 ** 9
+REPLACEMENT_STEP = 1.125
+
+
+@dataclass
+class FeePolicy:
+    """How fee fields are derived from the shared gas oracle quote.
+
+    ``auto`` uses EIP-1559 fields whenever the network reports a base fee.
+    Multipliers requested by callers (e.g. fee bumps) are capped at
+    ``max_multiplier``; ``max_fee_gwei`` caps the fee per gas (0 = no cap).
+    The same caps bound same-nonce replacements of stuck transactions.
+    ``min_priority_fee_gwei`` raises the node's suggested tip when it is lower.
+    """
+    mode: Literal["legacy", "eip1559", "auto"] = "legacy"
+    multiplier: float = 1.0
+    max_multiplier: float = 2.0
+    max_fee_gwei: float = 0
+    min_priority_fee_gwei: float = 0
+
+    def fee_params(self, quote: FeeQuote, bump: float = 1.0) -> dict[str, int]:
+        use_eip1559 = self.mode == "eip1559" or (self.mode == "auto" and quote.supports_eip1559)
+        return self._params(quote, min(self.multiplier * bump, self.max_multiplier), use_eip1559)
+
+    def replacement_params(
+        self, previous: TxParams, quote: FeeQuote, step: float = REPLACEMENT_STEP
+    ) -> dict[str, int] | None:
+        """Fees for re-sending ``previous`` at the same nonce, or None once the caps are reached.
+
+        Nodes only accept a replacement that raises every fee field by a
+        minimum step, so fees grow by ``step`` over the previous attempt or
+        follow the current network price, whichever is higher. The caps apply
+        to the fee per gas; the tip only has to stay within it, so a zero tip
+        can still be bumped.
+        """
+        use_eip1559 = "maxFeePerGas" in previous
+        current = self._params(quote, self.multiplier, use_eip1559)
+        ceiling = self._params(quote, self.max_multiplier, use_eip1559)
+
+        params = {field: max(int(previous[field] * step) + 1, value) for field, value in current.items()}
+        fee_field = "maxFeePerGas" if use_eip1559 else "gasPrice"
+        if params[fee_field] > ceiling[fee_field]:
+            return None
+        if use_eip1559 and params["maxPriorityFeePerGas"] > params["maxFeePerGas"]:
+            return None
+        return params
+
+    def _params(self, quote: FeeQuote, multiplier: float, use_eip1559: bool) -> dict[str, int]:
+        cap = int(self.max_fee_gwei * GWEI) or None
+
+        if use_eip1559:
+            params = quote.eip1559_params(multiplier)
+            missing_tip = int(self.min_priority_fee_gwei * GWEI) - params["maxPriorityFeePerGas"]
+            if missing_tip > 0:
+                params["maxPriorityFeePerGas"] += missing_tip
+                params["maxFeePerGas"] += missing_tip
+            if cap is not None and params["maxFeePerGas"] > cap:
+                params["maxFeePerGas"] = cap
+                params["maxPriorityFeePerGas"] = min(params["maxPriorityFeePerGas"], cap)
+            return params
+
+        params = quote.legacy_params(multiplier)
+        if cap is not None:
+            params["gasPrice"] = min(params["gasPrice"], cap)
+        return params
+
+
+class GasEstimateCache:
+    """Gas limits observed per (contract, selector), shared across wallets.
+
+    Only builds that opt in with ``reuse_estimate`` read from it: most calls
+    cost different gas depending on state (an ``approve`` from a zero
+    allowance costs more than from a non-zero one), so reusing another
+    wallet's estimate could run out of gas on-chain. ``forget`` drops an
+    entry, which wallets do when a transaction fails on-chain.
+    """
+
+    def __init__(self):
+        self._estimates: dict[tuple[str, str], int] = {}
+
+    @staticmethod
+    def _key(to: str, data: str) -> tuple[str, str]:
+        return to.lower(), data[:10]
+
+    def get(self, to: str, data: str) -> int | None:
+        return self._estimates.get(self._key(to, data))
+
+    def record(self, to: str, data: str, estimate: int) -> None:
+        key = self._key(to, data)
+        self._estimates[key] = max(estimate, self._estimates.get(key, 0))
+
+    def forget(self, to: str, data: str) -> None:
+        self._estimates.pop(self._key(to, data), None)
+
+
+class TransactionBuilder:
+    """Fills gas, fee and chain fields of transactions sent through one endpoint.
+
+    Plain value transfers (no calldata) take ``TRANSFER_GAS`` without asking
+    the node. Contract calls are estimated by the node, which also catches
+    reverts before anything is broadcast, unless the caller passes
+    ``reuse_estimate`` for a call whose cost does not depend on state.
+    Whatever is still missing (chain id, estimate) goes out in a single RPC
+    batch alongside the shared fee quote.
+    """
+
+    def __init__(self, provider, estimates: GasEstimateCache, policy: FeePolicy, gas_limit_multiplier: float = 1.2):
+        self.provider = provider
+        self.estimates = estimates
+        self.policy = policy
+        self.gas_limit_multiplier = gas_limit_multiplier
+        self._chain_id: int | None = None
+
+    async def _resolve(
+        self, sender: str, to: str, data: str, value: int, gas: int | None, reuse_estimate: bool
+    ) -> tuple[int, int]:
+        if gas is None and not data:
+            gas = TRANSFER_GAS
+        if gas is None and reuse_estimate:
+            cached = self.estimates.get(to, data)
+            if cached is not None:
+                gas = int(cached * self.gas_limit_multiplier)
+
+        if gas is not None and self._chain_id is not None:
+            return self._chain_id, gas
+
+        batch = RPCBatch(self.provider)
+        chain_index = batch.add("eth_chainId", []) if self._chain_id is None else None
+        estimate_index = batch.add(
+            "eth_estimateGas", [{"from": sender, "to": to, "data": data or "0x", "value": hex(value)}]
+        ) if gas is None else None
+        results = await batch.execute()
+
+        if chain_index is not None:
+            self._chain_id = results[chain_index]
+        if estimate_index is not None:
+            self.estimates.record(to, data, results[estimate_index])
+            gas = int(results[estimate_index] * self.gas_limit_multiplier)
+        return self._chain_id, gas
+
+    async def build(
+        self,
+        sender: str,
+        to: str,
+        data: str = "",
+        value: int = 0,
+        gas: int | None = None,
+        fee_bump: float = 1.0,
+        reuse_estimate: bool = False,
+    ) -> TxParams:
+        (chain_id, gas), quote = await asyncio.gather(
+            self._resolve(sender, to, data, value, gas, reuse_estimate),
+            gas_oracles.for_provider(self.provider).quote(),
+        )
+
+        transaction: TxParams = {
+            "chainId": chain_id,
+            "from": sender,
+            "to": to,
+            "value": value,
+            "gas": gas,
+            **self.policy.fee_params(quote, fee_bump),
+        }
+        if data:
+            transaction["data"] = data
+        return transaction
+
+
+class TransactionBuilderRegistry:
+    def __init__(self):
+        self.policy = FeePolicy()
+        self.gas_limit_multiplier = 1.2
+        self.estimates = GasEstimateCache()
+        self._builders: dict[str, TransactionBuilder] = {}
+
+    def configure(self, gas_limit_multiplier: float = 1.2, **policy) -> None:
+        self.policy = FeePolicy(**policy)
+        self.gas_limit_multiplier = gas_limit_multiplier
+        for builder in self._builders.values():
+            builder.policy = self.policy
+            builder.gas_limit_multiplier = gas_limit_multiplier
+
+    def for_provider(self, provider) -> TransactionBuilder:
+        builder = self._builders.get(provider.endpoint_uri)
+        if builder is None:
+            builder = TransactionBuilder(provider, self.estimates, self.policy, self.gas_limit_multiplier)
+            self._builders[provider.endpoint_uri] = builder
+        return builder
+
+
+tx_builders = TransactionBuilderRegistry()
@@ -0,0 +1,112 @@
+import time
+from dataclasses import dataclass
+
+from core.exceptions.base import RPCError
+from utils import SingleFlight
+
+from .batch import RPCBatch, hex_to_int
+
+
+@dataclass(frozen=True)
+class FeeQuote:
+    gas_price: int
+    base_fee: int | None
+    block_number: int
+    fetched_at: float
+    suggested_tip: int | None = None
+
+    @property
+    def supports_eip1559(self) -> bool:
+        return self.base_fee is not None
+
+    @property
+    def priority_fee(self) -> int:
+        if self.base_fee is None:
+            return 0
+        tip = self.suggested_tip if self.suggested_tip is not None else self.gas_price - self.base_fee
+        return max(tip, 0)
+
+    def legacy_params(self, multiplier: float = 1.0) -> dict[str, int]:
+        return {"gasPrice": int(self.gas_price * multiplier)}
+
+    def eip1559_params(self, multiplier: float = 1.0) -> dict[str, int]:
+        if self.base_fee is None:
+            raise ValueError("The network does not report a base fee, EIP-1559 fees are unavailable")
+
+        priority_fee = int(self.priority_fee * multiplier)
+        return {
+            "maxPriorityFeePerGas": priority_fee,
+            "maxFeePerGas": int(self.base_fee * 2 * multiplier) + priority_fee,
+        }
+
+
+class GasOracle:
+    """Fee data for one endpoint, shared by every wallet using it.
+
+    Concurrent callers of ``quote`` are coalesced into a single in-flight RPC
+    batch, and the result is reused for ``ttl_blocks`` blocks (approximated
+    by ``block_time``) or until a newer block is reported via ``on_block``.
+    """
+
+    def __init__(self, provider, ttl_blocks: int = 5, block_time: float = 1.0):
+        self.provider = provider
+        self.ttl_blocks = ttl_blocks
+        self.block_time = block_time
+        self._quote: FeeQuote | None = None
+        self._fetches = SingleFlight()
+
+    def _is_fresh(self, quote: FeeQuote) -> bool:
+        return time.monotonic() - quote.fetched_at < self.ttl_blocks * self.block_time
+
+    async def quote(self) -> FeeQuote:
+        if self._quote is not None and self._is_fresh(self._quote):
+            return self._quote
+
+        return await self._fetches.run(None, self._fetch)
+
+    def on_block(self, block_number: int) -> None:
+        if self._quote is not None and block_number >= self._quote.block_number + self.ttl_blocks:
+            self._quote = None
+
+    async def _fetch(self) -> FeeQuote:
+        batch = RPCBatch(self.provider)
+        batch.add("eth_gasPrice", [])
+        batch.add("eth_getBlockByNumber", ["latest", False], formatter=None)
+        batch.add("eth_maxPriorityFeePerGas", [])
+        gas_price, block, suggested_tip = await batch.execute(raise_on_error=False)
+        if gas_price is None or block is None:
+            raise RPCError("eth_gasPrice/eth_getBlockByNumber", "the node returned no fee data")
+
+        base_fee = block.get("baseFeePerGas")
+        self._quote = FeeQuote(
+            gas_price=gas_price,
+            base_fee=hex_to_int(base_fee) if base_fee is not None else None,
+            block_number=hex_to_int(block["number"]),
+            fetched_at=time.monotonic(),
+            suggested_tip=suggested_tip,
+        )
+        return self._quote
+
+
+class GasOracleRegistry:
+    def __init__(self, ttl_blocks: int = 5, block_time: float = 1.0):
+        self.ttl_blocks = ttl_blocks
+        self.block_time = block_time
+        self._oracles: dict[str, GasOracle] = {}
+
+    def configure(self, ttl_blocks: int, block_time: float) -> None:
+        self.ttl_blocks = ttl_blocks
+        self.block_time = block_time
+        for oracle in self._oracles.values():
+            oracle.ttl_blocks = ttl_blocks
+            oracle.block_time = block_time
+
+    def for_provider(self, provider) -> GasOracle:
+        oracle = self._oracles.get(provider.endpoint_uri)
+        if oracle is None:
+            oracle = GasOracle(provider, self.ttl_blocks, self.block_time)
+            self._oracles[provider.endpoint_uri] = oracle
+        return oracle
+
+
+gas_oracles = GasOracleRegistry()
@@ -0,0 +1,74 @@
+import asyncio
+
+from eth_utils import to_int
+
+NONCE_ERRORS = ("nonce too low", "invalid nonce", "nonce has already been used")
+ALREADY_KNOWN_ERRORS = ("already known", "known transaction")
+
+
+def is_nonce_error(error: Exception) -> bool:
+    message = str(error).lower()
+    return any(marker in message for marker in NONCE_ERRORS)
+
+
+def is_already_known(error: Exception) -> bool:
+    """The node already holds this exact signed transaction, e.g. after a failed-over resend."""
+    message = str(error).lower()
+    return any(marker in message for marker in ALREADY_KNOWN_ERRORS)
+
+
+class NonceManager:
+    """Reserves nonces for one address locally.
+
+    The node is asked for the pending transaction count once; after that
+    nonces are handed out from memory so several transactions can be signed
+    and broadcast back to back. ``resync`` goes back to the node, e.g. after
+    a "nonce too low" rejection.
+    """
+
+    def __init__(self, provider, address: str):
+        self.provider = provider
+        self.address = address
+        self._next: int | None = None
+        self._lock = asyncio.Lock()
+
+    async def _fetch(self) -> int:
+        response = await self.provider.make_request("eth_getTransactionCount", [self.address, "pending"])
+        if "error" in response:
+            raise ValueError(response["error"])
+        return to_int(hexstr=response["result"])
+
+    async def reserve(self) -> int:
+        async with self._lock:
+            if self._next is None:
+                self._next = await self._fetch()
+            nonce = self._next
+            self._next += 1
+            return nonce
+
+    def release(self, nonce: int) -> None:
+        if self._next == nonce + 1:
+            self._next = nonce
+
+    async def resync(self) -> None:
+        async with self._lock:
+            self._next = await self._fetch()
+
+    def invalidate(self) -> None:
+        """Forgets the local counter; the next ``reserve`` asks the node again."""
+        self._next = None
+
+
+class NonceManagerRegistry:
+    def __init__(self):
+        self._managers: dict[str, NonceManager] = {}
+
+    def get(self, provider, address: str) -> NonceManager:
+        manager = self._managers.get(address)
+        if manager is None:
+            manager = NonceManager(provider, address)
+            self._managers[address] = manager
+        return manager
+
+
+nonce_managers = NonceManagerRegistry()
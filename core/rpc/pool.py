@@ -0,0 +1,91 @@
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+
+@dataclass
+class EndpointStats:
+    url: str
+    latencies: deque = field(default_factory=lambda: deque(maxlen=100))
+    outcomes: deque = field(default_factory=lambda: deque(maxlen=50))
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    ejections: int = 0
+
+    def percentile(self, percent: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(int(len(ordered) * percent), len(ordered) - 1)]
+
+    @property
+    def p50(self) -> float:
+        return self.percentile(0.5)
+
+    @property
+    def p95(self) -> float:
+        return self.percentile(0.95)
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def is_healthy(self, now: float) -> bool:
+        return now >= self.ejected_until
+
+    def __str__(self) -> str:
+        return (
+            f"{self.url} | p50: {self.p50 * 1000:.0f}ms | p95: {self.p95 * 1000:.0f}ms | "
+            f"errors: {self.error_rate:.0%} | ejections: {self.ejections}"
+        )
+
+
+class EndpointPool:
+    """Health and latency bookkeeping for a set of interchangeable RPC endpoints.
+
+    Reads go to the healthy endpoint with the lowest rolling p50 latency;
+    unmeasured endpoints count as fastest so they get probed. Writes are
+    pinned to the first healthy endpoint in configuration order, so nonces
+    and the mempool stay consistent. Endpoints failing too often are ejected
+    for ``EJECT_SECONDS`` and readmitted automatically afterwards.
+    """
+    EJECT_SECONDS = 30.0
+    EJECT_ERROR_RATE = 0.5
+    MIN_SAMPLES = 5
+    MAX_CONSECUTIVE_FAILURES = 3
+
+    def __init__(self, urls: list[str]):
+        if not urls:
+            raise ValueError("Endpoint pool needs at least one RPC URL")
+        self.endpoints = [EndpointStats(url) for url in urls]
+
+    def _healthy(self) -> list[EndpointStats]:
+        now = time.monotonic()
+        healthy = [endpoint for endpoint in self.endpoints if endpoint.is_healthy(now)]
+        return healthy or sorted(self.endpoints, key=lambda endpoint: endpoint.ejected_until)
+
+    def read_order(self) -> list[EndpointStats]:
+        return sorted(self._healthy(), key=lambda endpoint: endpoint.p50)
+
+    def write_order(self) -> list[EndpointStats]:
+        return self._healthy()
+
+    def record_success(self, endpoint: EndpointStats, latency: float) -> None:
+        endpoint.latencies.append(latency)
+        endpoint.outcomes.append(True)
+        endpoint.consecutive_failures = 0
+
+    def record_failure(self, endpoint: EndpointStats) -> None:
+        endpoint.outcomes.append(False)
+        endpoint.consecutive_failures += 1
+
+        too_many_errors = (
+            len(endpoint.outcomes) >= self.MIN_SAMPLES and endpoint.error_rate >= self.EJECT_ERROR_RATE
+        )
+        if too_many_errors or endpoint.consecutive_failures >= self.MAX_CONSECUTIVE_FAILURES:
+            endpoint.ejected_until = time.monotonic() + self.EJECT_SECONDS
+            endpoint.ejections += 1
+            endpoint.outcomes.clear()
+            endpoint.consecutive_failures = 0
@@ -0,0 +1,181 @@
+import asyncio
+import time
+from typing import Callable
+
+from loguru import logger
+
+from .batch import RPCBatch, hex_to_int
+from .gas import gas_oracles
+
+
+class ReceiptTracker:
+    """Resolves transaction receipts for one endpoint from a single block loop.
+
+    Instead of every pending transaction polling on its own, the tracker polls
+    ``eth_blockNumber`` and, once per new block, fetches the receipts of all
+    watched hashes in batches. The loop only runs while something is pending.
+    Providers that support subscriptions push ``newHeads`` instead, and the
+    loop wakes up on each new head rather than on a timer.
+
+    ``blocks`` lets callers wait for a number of new blocks, which is how
+    wallets notice a transaction that is stuck in the mempool.
+    """
+    BATCH_SIZE = 100
+
+    def __init__(self, provider, poll_interval: float = 1.0, timeout: float = 120.0):
+        self.provider = provider
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.last_block: int | None = None
+        self._pending: dict[str, tuple[asyncio.Future, float]] = {}
+        self._block_waiters: list[tuple[int, int | None, asyncio.Future]] = []
+        self._block_listeners: list[Callable[[int], None]] = []
+        self._task: asyncio.Task | None = None
+        self._subscribed = False
+        self._head: int | None = None
+        self._new_head = asyncio.Event()
+
+    def add_block_listener(self, listener: Callable[[int], None]) -> None:
+        self._block_listeners.append(listener)
+
+    def watch(self, tx_hash: str, deadline: float | None = None) -> asyncio.Future:
+        """Future of the receipt; fails with TimeoutError at ``deadline`` (``time.monotonic()``, default ``timeout`` from now)."""
+        entry = self._pending.get(tx_hash)
+        if entry is not None:
+            return entry[0]
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[tx_hash] = (future, deadline if deadline is not None else time.monotonic() + self.timeout)
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return future
+
+    def blocks(self, count: int) -> asyncio.Future:
+        """Resolves once ``count`` new blocks have been seen (only while transactions are watched)."""
+        future = asyncio.get_running_loop().create_future()
+        target = self.last_block + count if self.last_block is not None else None
+        self._block_waiters.append((count, target, future))
+        return future
+
+    def _notify_block_waiters(self, block_number: int) -> None:
+        waiters, self._block_waiters = self._block_waiters, []
+        for count, target, future in waiters:
+            if future.done():
+                continue
+            if target is None:
+                target = block_number + count - 1
+            if block_number >= target:
+                future.set_result(block_number)
+            else:
+                self._block_waiters.append((count, target, future))
+
+    def forget(self, tx_hash: str) -> None:
+        entry = self._pending.pop(tx_hash, None)
+        if entry is not None and not entry[0].done():
+            entry[0].cancel()
+
+    def _on_head(self, head: dict) -> None:
+        self._head = hex_to_int(head["number"])
+        self._new_head.set()
+
+    async def _subscribe_heads(self) -> None:
+        if self._subscribed or not hasattr(self.provider, "subscribe"):
+            return
+
+        try:
+            await self.provider.subscribe(["newHeads"], self._on_head)
+            self._subscribed = True
+        except Exception as error:
+            logger.warning(f"Receipt tracker | newHeads subscription failed, polling instead: {error}")
+
+    async def _wait_next_block(self) -> None:
+        if not self._subscribed:
+            await asyncio.sleep(self.poll_interval)
+            return
+
+        try:
+            await asyncio.wait_for(self._new_head.wait(), self.poll_interval * 10)
+        except asyncio.TimeoutError:
+            self._head = None
+
+    async def _run(self) -> None:
+        await self._subscribe_heads()
+        while self._pending:
+            self._new_head.clear()
+            try:
+                block_number = self._head if self._head is not None else await self._block_number()
+                if self.last_block is None or block_number > self.last_block:
+                    self.last_block = block_number
+                    for listener in self._block_listeners:
+                        listener(block_number)
+                    self._notify_block_waiters(block_number)
+                    await self._check_pending()
+            except Exception as error:
+                logger.warning(f"Receipt tracker | Failed to poll {self.provider.endpoint_uri}: {error}")
+
+            self._expire()
+            if self._pending:
+                await self._wait_next_block()
+
+    async def _block_number(self) -> int:
+        batch = RPCBatch(self.provider)
+        batch.add("eth_blockNumber", [])
+        (block_number,) = await batch.execute()
+        return block_number
+
+    async def _check_pending(self) -> None:
+        hashes = list(self._pending)
+        for start in range(0, len(hashes), self.BATCH_SIZE):
+            chunk = hashes[start:start + self.BATCH_SIZE]
+            batch = RPCBatch(self.provider)
+            for tx_hash in chunk:
+                batch.add("eth_getTransactionReceipt", [tx_hash], formatter=None)
+
+            for tx_hash, receipt in zip(chunk, await batch.execute()):
+                entry = self._pending.pop(tx_hash, None) if receipt is not None else None
+                if entry is None:
+                    # No receipt yet, or forget() dropped the hash while the batch was in flight
+                    continue
+                future, _ = entry
+                if not future.done():
+                    future.set_result({
+                        **receipt,
+                        "status": hex_to_int(receipt["status"]),
+                        "blockNumber": hex_to_int(receipt["blockNumber"]),
+                    })
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for tx_hash, (future, deadline) in list(self._pending.items()):
+            if future.done():
+                self._pending.pop(tx_hash)
+            elif now >= deadline:
+                self._pending.pop(tx_hash)
+                future.set_exception(TimeoutError(f"Transaction {tx_hash} is not in the chain before its deadline"))
+
+
+class ReceiptTrackerRegistry:
+    def __init__(self, poll_interval: float = 1.0, timeout: float = 120.0, stuck_blocks: int = 20, max_replacements: int = 3):
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.stuck_blocks = stuck_blocks
+        self.max_replacements = max_replacements
+        self._trackers: dict[str, ReceiptTracker] = {}
+
+    def configure(self, poll_interval: float, timeout: float, stuck_blocks: int = 20, max_replacements: int = 3) -> None:
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.stuck_blocks = stuck_blocks
+        self.max_replacements = max_replacements
+
+    def for_provider(self, provider) -> ReceiptTracker:
+        tracker = self._trackers.get(provider.endpoint_uri)
+        if tracker is None:
+            tracker = ReceiptTracker(provider, self.poll_interval, self.timeout)
+            tracker.add_block_listener(gas_oracles.for_provider(provider).on_block)
+            self._trackers[provider.endpoint_uri] = tracker
+        return tracker
+
+
+receipt_trackers = ReceiptTrackerRegistry()
@@ -0,0 +1,214 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import aiohttp
+from better_proxy import Proxy
+from web3 import AsyncHTTPProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from core.exceptions.base import RPCError
+from .pool import EndpointPool
+from .websocket import WebSocketConnection, WebSocketRPCProvider
+
+
+@dataclass
+class TransportStats:
+    requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        opened = self.connections_created + self.connections_reused
+        return self.connections_reused / opened if opened else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"requests: {self.requests} | connections opened: {self.connections_created} | "
+            f"reused: {self.connections_reused} ({self.reuse_ratio:.0%})"
+        )
+
+
+class RPCSessionPool:
+    """Process-wide aiohttp session used by every JSON-RPC provider.
+
+    A single connector keeps keep-alive connections per (host, proxy), so
+    wallets pointing at the same endpoint through the same proxy share TCP/TLS
+    connections instead of each opening their own.
+    """
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 0, keepalive_timeout: float = 30.0, timeout: float = 30.0):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.stats = TransportStats()
+        self._session: aiohttp.ClientSession | None = None
+
+    def configure(self, limit: int, limit_per_host: int, keepalive_timeout: float, timeout: float) -> None:
+        if self._session is not None:
+            raise RuntimeError("RPC session pool is already in use")
+
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        async def on_request_start(*_):
+            self.stats.requests += 1
+
+        async def on_connection_create_end(*_):
+            self.stats.connections_created += 1
+
+        async def on_connection_reuseconn(*_):
+            self.stats.connections_reused += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ssl=False,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                trace_configs=[self._trace_config()],
+            )
+        return self._session
+
+    async def post(self, url: str, data: bytes, headers: dict[str, str], proxy: str | None = None) -> bytes:
+        async with self.session().post(url, data=data, headers=headers, proxy=proxy) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    @property
+    def open_connections(self) -> int:
+        if self._session is None or self._session.closed:
+            return 0
+        connector = self._session.connector
+        idle = sum(len(connections) for connections in getattr(connector, "_conns", {}).values())
+        return idle + len(getattr(connector, "_acquired", ()))
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+rpc_sessions = RPCSessionPool()
+
+
+class PooledHTTPProvider(AsyncHTTPProvider):
+    def __init__(self, endpoint_uri: str, proxy: str | None = None, pool: RPCSessionPool = rpc_sessions):
+        super().__init__(endpoint_uri)
+        self.proxy = proxy
+        self.pool = pool
+
+    async def _post(self, data: bytes, methods: list[str]) -> bytes:
+        return await self.pool.post(self.endpoint_uri, data, self.get_request_headers(), self.proxy)
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        request_data = self.encode_rpc_request(method, params)
+        raw_response = await self._post(request_data, [method])
+        return self.decode_rpc_response(raw_response)
+
+    async def make_batch_request(self, calls: list[tuple[str, list]]) -> list[RPCResponse]:
+        payload = [
+            {"jsonrpc": "2.0", "method": method, "params": params, "id": next(self.request_counter)}
+            for method, params in calls
+        ]
+        raw_response = await self._post(json.dumps(payload).encode(), [method for method, _ in calls])
+        responses = json.loads(raw_response)
+
+        if not isinstance(responses, list):
+            raise RPCError("batch", responses.get("error", responses))
+
+        by_id = {response.get("id"): response for response in responses}
+        return [
+            by_id.get(request["id"], {"error": "missing response in batch"})
+            for request in payload
+        ]
+
+
+class MultiEndpointProvider(PooledHTTPProvider):
+    """Routes each request through an ``EndpointPool`` and fails over on transport errors."""
+    WRITE_METHODS = frozenset({"eth_sendRawTransaction", "eth_getTransactionCount"})
+
+    def __init__(self, endpoints: EndpointPool, proxy: str | None = None, pool: RPCSessionPool = rpc_sessions):
+        super().__init__(endpoints.endpoints[0].url, proxy, pool)
+        self.endpoints = endpoints
+        self.endpoint_uri = "pool:" + ",".join(endpoint.url for endpoint in endpoints.endpoints)
+
+    async def _post(self, data: bytes, methods: list[str]) -> bytes:
+        is_write = any(method in self.WRITE_METHODS for method in methods)
+        candidates = self.endpoints.write_order() if is_write else self.endpoints.read_order()
+
+        last_error: Exception | None = None
+        for endpoint in candidates:
+            started = time.monotonic()
+            try:
+                response = await self.pool.post(endpoint.url, data, self.get_request_headers(), self.proxy)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                self.endpoints.record_failure(endpoint)
+                last_error = error
+                continue
+
+            self.endpoints.record_success(endpoint, time.monotonic() - started)
+            return response
+
+        raise ConnectionError(f"All RPC endpoints failed: {last_error}")
+
+
+_providers: dict[tuple[tuple[str, ...], str | None], PooledHTTPProvider] = {}
+_websocket_providers: dict[tuple[str, ...], WebSocketRPCProvider] = {}
+endpoint_pools: dict[tuple[str, ...], EndpointPool] = {}
+
+
+def _endpoint_key(rpc_url: str | list[str]) -> tuple[str, ...]:
+    if isinstance(rpc_url, (list, tuple)):
+        return tuple(str(url) for url in rpc_url)
+    return (str(rpc_url),)
+
+
+def use_websocket(rpc_url: str | list[str], ws_url: str) -> None:
+    """Serve every wallet of ``rpc_url`` through one shared WebSocket connection to ``ws_url``."""
+    _websocket_providers[_endpoint_key(rpc_url)] = WebSocketRPCProvider(WebSocketConnection(ws_url))
+
+
+def get_provider(
+    rpc_url: str | list[str], proxy: Proxy | None = None
+) -> PooledHTTPProvider | WebSocketRPCProvider:
+    urls = _endpoint_key(rpc_url)
+    websocket_provider = _websocket_providers.get(urls)
+    if websocket_provider is not None:
+        return websocket_provider
+
+    key = (urls, proxy.as_url if proxy else None)
+    provider = _providers.get(key)
+    if provider is None:
+        if len(urls) == 1:
+            provider = PooledHTTPProvider(urls[0], key[1])
+        else:
+            if urls not in endpoint_pools:
+                endpoint_pools[urls] = EndpointPool(list(urls))
+            provider = MultiEndpointProvider(endpoint_pools[urls], key[1])
+        _providers[key] = provider
+    return provider
+
+
+async def close_transports() -> None:
+    await rpc_sessions.close()
+    for provider in _websocket_providers.values():
+        await provider.connection.close()
@@ -0,0 +1,145 @@
+import asyncio
+import itertools
+import json
+from typing import Any, Callable
+
+import websockets
+from loguru import logger
+from web3.providers.async_base import AsyncJSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+
+class WebSocketConnection:
+    """One persistent socket multiplexing JSON-RPC requests and subscriptions.
+
+    Responses are matched to waiting requests by id, subscription
+    notifications are routed to their callbacks. After a disconnect the next
+    request reconnects and every subscription is re-established.
+    """
+
+    def __init__(self, url: str, request_timeout: float = 30.0):
+        self.url = url
+        self.request_timeout = request_timeout
+        self._socket = None
+        self._reader: asyncio.Task | None = None
+        self._connect_lock = asyncio.Lock()
+        self._ids = itertools.count(1)
+        self._requests: dict[int, asyncio.Future] = {}
+        self._subscriptions: dict[str, tuple[list, Callable[[Any], None]]] = {}
+
+    async def _ensure_connected(self) -> None:
+        async with self._connect_lock:
+            if self._socket is not None:
+                return
+
+            self._socket = await websockets.connect(self.url, max_size=None)
+            self._reader = asyncio.create_task(self._read_loop(self._socket))
+
+            subscriptions, self._subscriptions = self._subscriptions, {}
+            for params, callback in subscriptions.values():
+                await self._subscribe(params, callback)
+
+    async def _read_loop(self, socket) -> None:
+        try:
+            async for message in socket:
+                data = json.loads(message)
+                for item in data if isinstance(data, list) else [data]:
+                    self._dispatch(item)
+        except websockets.ConnectionClosed as error:
+            logger.warning(f"WebSocket RPC | Connection to {self.url} closed: {error}")
+        finally:
+            if self._socket is socket:
+                self._socket = None
+            for future in self._requests.values():
+                if not future.done():
+                    future.set_exception(ConnectionError(f"WebSocket connection to {self.url} was closed"))
+            self._requests.clear()
+
+    def _dispatch(self, item: dict) -> None:
+        if item.get("method") == "eth_subscription":
+            params = item["params"]
+            subscription = self._subscriptions.get(params["subscription"])
+            if subscription is not None:
+                subscription[1](params["result"])
+            return
+
+        future = self._requests.pop(item.get("id"), None)
+        if future is not None and not future.done():
+            future.set_result(item)
+
+    async def _send(self, payload: list[dict] | dict) -> list[RPCResponse]:
+        await self._ensure_connected()
+        return await self._send_raw(payload)
+
+    async def _send_raw(self, payload: list[dict] | dict) -> list[RPCResponse]:
+        requests = payload if isinstance(payload, list) else [payload]
+
+        loop = asyncio.get_running_loop()
+        futures = []
+        for request in requests:
+            future = loop.create_future()
+            self._requests[request["id"]] = future
+            futures.append(future)
+
+        try:
+            await self._socket.send(json.dumps(payload))
+            return list(await asyncio.wait_for(asyncio.gather(*futures), self.request_timeout))
+        finally:
+            for request in requests:
+                self._requests.pop(request["id"], None)
+
+    def _payload(self, method: str, params: Any) -> dict:
+        return {"jsonrpc": "2.0", "method": method, "params": params, "id": next(self._ids)}
+
+    async def request(self, method: str, params: Any) -> RPCResponse:
+        (response,) = await self._send(self._payload(method, params))
+        return response
+
+    async def batch(self, calls: list[tuple[str, Any]]) -> list[RPCResponse]:
+        return await self._send([self._payload(method, params) for method, params in calls])
+
+    async def _subscribe(self, params: list, callback: Callable[[Any], None]) -> str:
+        (response,) = await self._send_raw(self._payload("eth_subscribe", params))
+        if "error" in response:
+            raise ValueError(response["error"])
+
+        subscription_id = response["result"]
+        self._subscriptions[subscription_id] = (params, callback)
+        return subscription_id
+
+    async def subscribe(self, params: list, callback: Callable[[Any], None]) -> str:
+        await self._ensure_connected()
+        return await self._subscribe(params, callback)
+
+    async def close(self) -> None:
+        if self._socket is not None:
+            await self._socket.close()
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+        self._socket = None
+        self._reader = None
+
+
+class WebSocketRPCProvider(AsyncJSONBaseProvider):
+    def __init__(self, connection: WebSocketConnection):
+        super().__init__()
+        self.connection = connection
+        self.endpoint_uri = connection.url
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return await self.connection.request(method, params)
+
+    async def make_batch_request(self, calls: list[tuple[str, list]]) -> list[RPCResponse]:
+        return await self.connection.batch(calls)
+
+    async def subscribe(self, params: list, callback: Callable[[Any], None]) -> str:
+        return await self.connection.subscribe(params, callback)
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        try:
+            response = await self.make_request(RPCEndpoint("web3_clientVersion"), [])
+        except Exception:
+            if show_traceback:
+                raise
+            return False
+        return "result" in response
@@ -0,0 +1,76 @@
+import hashlib
+
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from eth_account.signers.local import LocalAccount
+from eth_typing import HexStr
+
+from utils import JsonCache, keypairs
+
+
+class SignatureCache(JsonCache):
+    """EIP-191 signatures keyed by (address, message hash).
+
+    RFC 6979 signatures are deterministic, so signing the same message with
+    the same key always yields the same bytes and the ECDSA work can be
+    skipped on repeats. With ``load`` the cache is also kept on disk between
+    runs; ``save`` only writes when something new was signed.
+    """
+    NAME = "Signature cache"
+
+    def __init__(self):
+        super().__init__()
+        self._signatures: dict[str, str] = {}
+
+    @staticmethod
+    def _key(address: str, text: str) -> str:
+        return f"{address.lower()}:{hashlib.sha256(text.encode()).hexdigest()}"
+
+    def _dump(self) -> dict[str, str]:
+        return self._signatures
+
+    def _restore(self, data: dict) -> None:
+        self._signatures = {str(key): str(signature) for key, signature in data.items()}
+
+    def get(self, address: str, text: str) -> str | None:
+        return self._signatures.get(self._key(address, text))
+
+    def put(self, address: str, text: str, signature: str) -> None:
+        self._signatures[self._key(address, text)] = signature
+        self._touch()
+
+
+signatures = SignatureCache()
+
+
+class Signer:
+    """Wallet identity for modules that only talk to HTTP APIs.
+
+    Holds no RPC provider: the address comes from the shared keypair cache
+    (or the on-disk address index) and the keypair is only derived on the
+    first signature. Signatures made with the wallet's own key go through
+    the shared ``signatures`` cache.
+    """
+
+    def __init__(self, mnemonic: str):
+        self._pk_or_mnemonic = mnemonic
+
+    @property
+    def keypair(self) -> LocalAccount:
+        return keypairs.keypair(self._pk_or_mnemonic)
+
+    @property
+    def wallet_address(self) -> str:
+        return keypairs.address(self._pk_or_mnemonic)
+
+    async def get_signature(self, text: str, private_key: str | None = None) -> HexStr:
+        if private_key is not None:
+            temp_keypair = Account.from_key(private_key)
+            return HexStr(temp_keypair.sign_message(encode_defunct(text=text)).signature.hex())
+
+        address = self.wallet_address
+        signature = signatures.get(address, text)
+        if signature is None:
+            signature = self.keypair.sign_message(encode_defunct(text=text)).signature.hex()
+            signatures.put(address, text, signature)
+        return HexStr(signature)
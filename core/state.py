@@ -0,0 +1,85 @@
+import sqlite3
+import time
+from pathlib import Path
+
+
+class StateStore:
+    """Per-account, per-module progress kept in a local SQLite database.
+
+    Each row records when ``step`` of ``module`` last completed for a wallet;
+    ``COMPLETED`` marks the whole module as done.
+    """
+    COMPLETED = "completed"
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS steps (
+                address TEXT NOT NULL,
+                module TEXT NOT NULL,
+                step TEXT NOT NULL,
+                completed_at REAL NOT NULL,
+                PRIMARY KEY (address, module, step)
+            )
+            """
+        )
+
+    def mark(self, address: str, module: str, step: str = COMPLETED) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO steps (address, module, step, completed_at) VALUES (?, ?, ?, ?)",
+            (address.lower(), module, step, time.time()),
+        )
+
+    def completed_at(self, address: str, module: str, step: str = COMPLETED) -> float | None:
+        row = self._connection.execute(
+            "SELECT completed_at FROM steps WHERE address = ? AND module = ? AND step = ?",
+            (address.lower(), module, step),
+        ).fetchone()
+        return row[0] if row else None
+
+    def is_done(self, address: str, module: str, step: str = COMPLETED, ttl: float | None = None) -> bool:
+        completed_at = self.completed_at(address, module, step)
+        if completed_at is None:
+            return False
+        return ttl is None or time.time() - completed_at < ttl
+
+    def steps(self, address: str, module: str) -> dict[str, float]:
+        rows = self._connection.execute(
+            "SELECT step, completed_at FROM steps WHERE address = ? AND module = ?",
+            (address.lower(), module),
+        ).fetchall()
+        return dict(rows)
+
+    def clear(self, address: str, module: str) -> None:
+        self._connection.execute(
+            "DELETE FROM steps WHERE address = ? AND module = ?",
+            (address.lower(), module),
+        )
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class Checkpoints:
+    """Step checkpoints of one module run for a single wallet.
+
+    With ``resume`` disabled previously recorded steps are ignored, so the run
+    starts from scratch, but new checkpoints are still written.
+    """
+
+    def __init__(self, store: StateStore, address: str, module: str, resume: bool = True):
+        self.store = store
+        self.address = address
+        self.module = module
+        self._done = set(store.steps(address, module)) if resume else set()
+
+    def done(self, step: str) -> bool:
+        return step in self._done
+
+    def mark(self, step: str) -> None:
+        self.store.mark(self.address, self.module, step)
+        self._done.add(step)
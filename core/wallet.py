@@ -1,38 +1,57 @@
+import asyncio
+import time
 from typing import Any
 
 from better_proxy import Proxy
 from eth_account import Account
-from eth_account.messages import encode_defunct
 from eth_typing import ChecksumAddress
-from eth_typing import HexStr
+from loguru import logger
 
 from pydantic import HttpUrl
-from web3 import AsyncWeb3, AsyncHTTPProvider
+from web3 import AsyncWeb3
 from web3.contract import AsyncContract
 from web3.eth import AsyncEth
 from web3.types import Nonce, TxParams
 
+from core.contracts import abi_registry, erc20, token_registry
+from core.rpc import (
+    FeeQuote,
+    NonceManager,
+    RPCBatch,
+    TransactionBuilder,
+    gas_oracles,
+    get_provider,
+    is_already_known,
+    is_nonce_error,
+    nonce_managers,
+    receipt_trackers,
+    tx_builders,
+)
+from core.signer import Signer
 from models import Erc20Contract
+from utils import AsyncClosable
 
-Account.enable_unaudited_hdwallet_features()
 
+class Wallet(Signer, AsyncWeb3, Account, AsyncClosable):
+    def __init__(self, mnemonic: str, rpc_url: HttpUrl | str | list[str], proxy: Proxy = None):
+        provider = get_provider(rpc_url, proxy)
 
-class Wallet(AsyncWeb3, Account):
-    def __init__(self, mnemonic: str, rpc_url: HttpUrl | str, proxy: Proxy = None):
-        provider = AsyncHTTPProvider(
-            str(rpc_url),
-            request_kwargs={
-                "proxy": proxy.as_url if proxy else None,
-                "ssl": False
-            }
-        )
+        AsyncWeb3.__init__(self, provider, modules={"eth": (AsyncEth,)})
+        Signer.__init__(self, mnemonic)
+        self._pending_confirmations: list[asyncio.Task] = []
 
-        super().__init__(provider, modules={"eth": (AsyncEth,)})
-        self.keypair = self.from_mnemonic(mnemonic) if len(mnemonic.split()) in (12, 24) else self.from_key(mnemonic)
+    async def close(self) -> None:
+        """Stops waiting for unconfirmed transactions; the RPC provider is shared and closed at exit."""
+        tasks, self._pending_confirmations = self._pending_confirmations, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
-    @property
-    def wallet_address(self):
-        return self.keypair.address
+    def batch(self) -> RPCBatch:
+        return RPCBatch(self.provider)
+
+    async def fee_quote(self) -> FeeQuote:
+        return await gas_oracles.for_provider(self.provider).quote()
 
     @staticmethod
     def _get_checksum_address(address: str) -> ChecksumAddress:
@@ -40,44 +59,46 @@ class Wallet(AsyncWeb3, Account):
 
     def get_contract(self, contract: Erc20Contract | str | object) -> AsyncContract:
         if isinstance(contract, str):
-            return self.eth.contract(
-                address=AsyncWeb3.to_checksum_address(contract),
-                abi=Erc20Contract().abi
-            )
+            return abi_registry.contract(self.provider, contract, "erc_20")
         elif hasattr(contract, "address") and hasattr(contract, "abi"):
-            return self.eth.contract(
-                address=AsyncWeb3.to_checksum_address(contract.address),
-                abi=contract.abi
-            )
+            return abi_registry.contract_for_abi(self.provider, contract.address, contract.abi)
         else:
             raise TypeError(
                 "Invalid contract type: expected Erc20Contract, str, or a contract-like object with address and abi")
 
-    async def token_balance(self, token_address: str) -> int:
-        contract = self.get_contract(token_address)
+    async def _erc20_call(self, token_address: str, data: str) -> int:
+        batch = self.batch()
+        batch.add("eth_call", erc20.call_params(token_address, data), formatter=erc20.decode_uint)
+        (result,) = await batch.execute()
+        return result
 
-        return await contract.functions.balanceOf(
-            AsyncWeb3.to_checksum_address(self.keypair.address)
-        ).call()
+    async def token_balance(self, token_address: str) -> int:
+        return await self._erc20_call(token_address, erc20.balance_of(self.keypair.address))
 
     async def convert_amount_to_decimals(self, amount: float, token_address: str) -> int:
-        if token_address == AsyncWeb3.to_checksum_address("0x0000000000000000000000000000000000000000") or token_address == AsyncWeb3.to_checksum_address("0x4200000000000000000000000000000000000006"):
+        if token_registry.is_native(token_address):
             return AsyncWeb3.to_wei(amount, 'ether')
 
-        token_contract = self.get_contract(token_address)
-        decimals = await token_contract.functions.decimals().call()
+        decimals = await token_registry.decimals(token_address, self.provider)
 
         return int(amount * (10 ** decimals))
     
     async def convert_amount_from_decimals(self, amount: int, token_address: str) -> float:
-        if token_address == AsyncWeb3.to_checksum_address("0x0000000000000000000000000000000000000000") or token_address == AsyncWeb3.to_checksum_address("0x4200000000000000000000000000000000000006"):
+        if token_registry.is_native(token_address):
             return AsyncWeb3.from_wei(amount, 'ether')
 
-        token_contract = self.get_contract(token_address)
-        decimals = await token_contract.functions.decimals().call()
+        decimals = await token_registry.decimals(token_address, self.provider)
 
         return amount / (10 ** decimals)
 
+    @property
+    def tx_builder(self) -> TransactionBuilder:
+        return tx_builders.for_provider(self.provider)
+
+    @property
+    def nonces(self) -> NonceManager:
+        return nonce_managers.get(self.provider, self.keypair.address)
+
     async def transactions_count(self) -> Nonce:
         return await self.eth.get_transaction_count(self.keypair.address)
 
@@ -91,17 +112,19 @@ class Wallet(AsyncWeb3, Account):
         balance = await self.eth.get_balance(self.keypair.address)
         return float(AsyncWeb3.from_wei(balance, "ether"))
 
-    async def _build_base_transaction(self, contract_function) -> TxParams:
-        gas_estimate = await contract_function.estimate_gas({"from": self.keypair.address})
-
-        return {
-            "gasPrice": await self.eth.gas_price,
-            "nonce": await self.transactions_count(),
-            "gas": int(gas_estimate * 1.2),
-        }
+    async def _build_base_transaction(self, contract_function, value: int = 0) -> TxParams:
+        return await self.tx_builder.build(
+            self.keypair.address,
+            contract_function.address,
+            contract_function._encode_transaction_data(),
+            value,
+        )
 
-    async def check_trx_availability(self, transaction: TxParams) -> None:
-        balance = await self.human_balance()
+    async def check_trx_availability(self, transaction: TxParams, balance_wei: int | None = None) -> None:
+        if balance_wei is None:
+            balance = await self.human_balance()
+        else:
+            balance = float(AsyncWeb3.from_wei(balance_wei, "ether"))
         required = float(self.from_wei(int(transaction.get('value', 0)), "ether"))
 
         if balance < required:
@@ -115,44 +138,149 @@ class Wallet(AsyncWeb3, Account):
         except Exception as error:
             return False, str(error)
 
-    async def get_signature(self, text: str, private_key: str | None = None) -> HexStr:
-        encoded_message = encode_defunct(text=text)
-        
-        if private_key is not None:
-            temp_keypair = self.from_key(private_key)
-            signature = temp_keypair.sign_message(encoded_message)
-        else:
-            signature = self.keypair.sign_message(encoded_message)
-            
-        return HexStr(signature.signature.hex())
+    async def _send_signed(self, trx: TxParams) -> str:
+        signed = self.keypair.sign_transaction(trx)
+        try:
+            return (await self.eth.send_raw_transaction(signed.rawTransaction)).hex()
+        except ValueError as error:
+            if is_already_known(error):
+                return signed.hash.hex()
+            raise
+
+    async def _broadcast(self, trx: Any) -> tuple[str, TxParams]:
+        for attempt in range(2):
+            nonce = await self.nonces.reserve()
+            sent = {**trx, "nonce": nonce}
+            try:
+                return await self._send_signed(sent), sent
+            except ValueError as error:
+                if attempt == 0 and is_nonce_error(error):
+                    await self.nonces.resync()
+                    continue
+                self.nonces.release(nonce)
+                raise
+            except asyncio.CancelledError:
+                self.nonces.invalidate()
+                raise
+            except Exception:
+                # Transport failure: the transaction may or may not have reached the node
+                await self._resync_nonces()
+                raise
+
+    async def _resync_nonces(self) -> None:
+        try:
+            await self.nonces.resync()
+        except Exception:
+            self.nonces.invalidate()
+
+    async def _replace(self, trx: TxParams) -> tuple[str, TxParams] | None:
+        try:
+            fees = self.tx_builder.policy.replacement_params(trx, await self.fee_quote())
+            if fees is None:
+                return None
+
+            replacement = {**trx, **fees}
+            return await self._send_signed(replacement), replacement
+        except Exception as error:
+            # The original transaction is still watched, so a failed replacement only ends the bumping
+            logger.warning(f"Account {self.wallet_address} | Replacement of nonce {trx['nonce']} failed: {error}")
+            return None
+
+    async def _confirm(self, tx_hash: str, trx: TxParams) -> tuple[bool, str]:
+        """Waits for the receipt, replacing the transaction with higher fees while it is stuck.
+
+        Every ``stuck_blocks`` blocks without a receipt the transaction is
+        re-sent at the same nonce with bumped fees, at most
+        ``max_replacements`` times and within the fee policy caps; whichever
+        version gets mined first settles the result. All versions share one
+        deadline, ``receipts.timeout`` after the first broadcast.
+        """
+        tracker = receipt_trackers.for_provider(self.provider)
+        deadline = time.monotonic() + receipt_trackers.timeout
+        watched = {tx_hash: tracker.watch(tx_hash, deadline)}
+        replacements = 0
+        stuck: asyncio.Future | None = None
+
+        try:
+            while True:
+                if stuck is not None:
+                    stuck.cancel()
+                can_replace = receipt_trackers.stuck_blocks > 0 and replacements < receipt_trackers.max_replacements
+                stuck = tracker.blocks(receipt_trackers.stuck_blocks) if can_replace else None
+                await asyncio.wait(
+                    [*watched.values(), *([stuck] if stuck else [])], return_when=asyncio.FIRST_COMPLETED
+                )
+
+                error = None
+                for watched_hash, future in list(watched.items()):
+                    if not future.done():
+                        continue
+                    if future.exception() is None:
+                        succeeded = future.result()["status"] == 1
+                        if not succeeded and trx.get("data"):
+                            # May have run out of gas on a reused estimate; the next build asks the node
+                            self.tx_builder.estimates.forget(trx["to"], trx["data"])
+                        return succeeded, watched_hash
+                    error = future.exception()
+                    del watched[watched_hash]
+                if not watched:
+                    # Timed out or dropped: later nonces must not queue up behind one that never lands
+                    await self._resync_nonces()
+                    raise error
+
+                if stuck is not None and stuck.done():
+                    replacements += 1
+                    replaced = await self._replace(trx)
+                    if replaced is None:
+                        replacements = receipt_trackers.max_replacements
+                        continue
+                    tx_hash, trx = replaced
+                    watched[tx_hash] = tracker.watch(tx_hash, deadline)
+                    logger.warning(
+                        f"Account {self.wallet_address} | Transaction stuck for {receipt_trackers.stuck_blocks} "
+                        f"blocks, replaced with higher fees: {tx_hash}"
+                    )
+        finally:
+            if stuck is not None:
+                stuck.cancel()
+            for watched_hash in watched:
+                tracker.forget(watched_hash)
+
+    async def submit_transaction(self, trx: Any) -> str:
+        """Broadcasts with a locally reserved nonce; the receipt is awaited in the background."""
+        tx_hash, sent = await self._broadcast(trx)
+        self._pending_confirmations.append(asyncio.create_task(self._confirm(tx_hash, sent)))
+        return tx_hash
+
+    async def wait_for_confirmations(self) -> list[tuple[bool, str]]:
+        tasks, self._pending_confirmations = self._pending_confirmations, []
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return [
+            (False, str(result)) if isinstance(result, BaseException) else result
+            for result in results
+        ]
 
     async def send_and_verify_transaction(self, trx: Any) -> tuple[bool | Any, str]:
-        signed = self.keypair.sign_transaction(trx)
-        tx_hash = await self.eth.send_raw_transaction(signed.rawTransaction)
-        receipt = await self.eth.wait_for_transaction_receipt(tx_hash)
-        return receipt["status"] == 1, tx_hash.hex()
+        tx_hash, sent = await self._broadcast(trx)
+        return await self._confirm(tx_hash, sent)
 
     async def _check_and_approve_token(
         self, token_address: str, spender_address: str, amount: int
     ) -> tuple[bool, str]:
         try:
-            token_contract = self.get_contract(token_address)
-
-            current_allowance = await token_contract.functions.allowance(
-                self.wallet_address, spender_address
-            ).call()
+            current_allowance = await self._erc20_call(
+                token_address, erc20.allowance(self.wallet_address, spender_address)
+            )
 
             if current_allowance >= amount:
                 return True, "Allowance already sufficient"
 
-            approve_tx = await token_contract.functions.approve(
-                spender_address, amount
-            ).build_transaction({
-                "nonce": await self.transactions_count(),
-                "gasPrice": int(await self.eth.gas_price * 1.25),
-                "gas": 3_000_000,
-                "from": self.wallet_address,
-            })
+            approve_tx = await self.tx_builder.build(
+                self.wallet_address,
+                self._get_checksum_address(token_address),
+                erc20.approve(spender_address, amount),
+                fee_bump=1.25,
+            )
 
             success, result = await self._process_transaction(approve_tx)
             if not success:
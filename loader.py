@@ -1,8 +1,29 @@
-import asyncio
-
-from utils import load_config, AccountProgress
+from core.auth import auth_tokens
+from core.contracts import token_registry
+from core.rpc import gas_oracles, receipt_trackers, rpc_sessions, tx_builders, use_websocket
+from core.signer import signatures
+from core.state import StateStore
+from utils import load_config, is_main_process, AccountProgress, ThroughputMeter, WorkerSlots
 
 config = load_config()
-semaphore = asyncio.Semaphore(config.threads)
+semaphore = WorkerSlots(config.threads)
 progress = AccountProgress(len(config.accounts))
+throughput = ThroughputMeter()
+state: StateStore | None = None
 
+# Spawned key derivation workers re-import the entry module; they must not
+# reopen the state store, the caches or the transports of the main process
+if is_main_process():
+    rpc_sessions.configure(**config.rpc_pool.model_dump())
+    gas_oracles.configure(**config.gas_oracle.model_dump())
+    receipt_trackers.configure(**config.receipts.model_dump())
+    tx_builders.configure(**config.fees.model_dump())
+    token_registry.load("./config/data/token_metadata.json")
+    token_registry.preload(config.tokens)
+    if config.rpc_transport == "ws":
+        use_websocket(config.somnia_rpc, config.somnia_ws)
+    state = StateStore("./config/data/state.db")
+    if config.signature_cache:
+        signatures.load("./config/data/signatures.json")
+    if config.auth_token_cache:
+        auth_tokens.load("./config/data/auth_tokens.json")
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Literal, Optional
 
 from better_proxy import Proxy
 from pydantic import BaseModel, Field, ConfigDict, validator
@@ -13,6 +13,7 @@ class Account:
     referral_codes: list[tuple[str, int]] | None = None
     referral_private_keys: list[str] | None = None
     token_discord: Optional[str] = None
+    address: Optional[str] = None
 
 class DelayRange(BaseModel):
     min: int
@@ -25,6 +26,51 @@ class DelayRange(BaseModel):
         return v
 
 
+class AmountRange(BaseModel):
+    min: float
+    max: float
+
+    @validator('max')
+    def max_greater_than_min(cls, v, values):
+        if 'min' in values and v < values['min']:
+            raise ValueError('max must be greater than min')
+        return v
+
+
+class TransferSTTSettings(BaseModel):
+    batch_size: int = 1
+    amount: Optional[AmountRange] = None
+    recipients: list[str] = Field(default_factory=list)
+
+
+class RPCPoolSettings(BaseModel):
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 30.0
+    timeout: float = 30.0
+
+
+class GasOracleSettings(BaseModel):
+    ttl_blocks: int = 5
+    block_time: float = 1.0
+
+
+class FeeSettings(BaseModel):
+    mode: Literal["legacy", "eip1559", "auto"] = "legacy"
+    multiplier: float = 1.0
+    max_multiplier: float = 2.0
+    max_fee_gwei: float = 0
+    min_priority_fee_gwei: float = 0
+    gas_limit_multiplier: float = 1.2
+
+
+class ReceiptTrackerSettings(BaseModel):
+    poll_interval: float = 1.0
+    timeout: float = 120.0
+    stuck_blocks: int = 20
+    max_replacements: int = 3
+
+
 class Token(BaseModel):
     name: str
     address: str
@@ -46,9 +92,22 @@ class Config(BaseModel):
     cap_monster: str = ""
     two_captcha: str = ""
     capsolver: str = ""
-    somnia_rpc: str = ""
+    somnia_rpc: str | list[str] = ""
+    somnia_ws: str = ""
+    rpc_transport: Literal["http", "ws"] = "http"
+    rpc_pool: RPCPoolSettings = Field(default_factory=RPCPoolSettings)
+    gas_oracle: GasOracleSettings = Field(default_factory=GasOracleSettings)
+    fees: FeeSettings = Field(default_factory=FeeSettings)
+    receipts: ReceiptTrackerSettings = Field(default_factory=ReceiptTrackerSettings)
     referral_code: str = ""
+    transfer_stt: TransferSTTSettings = Field(default_factory=TransferSTTSettings)
     tokens: list[Token] = Field(default_factory=list)
     delay_before_start: DelayRange
     threads: int
+    address_index: bool = False
+    derivation_workers: int = 0
+    resume: bool = True
+    signature_cache: bool = False
+    auth_token_cache: bool = False
+    pipeline_workers: int = 0
     module: str = ""
\ No newline at end of file
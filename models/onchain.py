@@ -1,6 +1,10 @@
-from dataclasses import dataclass
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ERC20_ABI: list = json.loads(Path("./abi/erc_20.json").read_text(encoding="utf-8"))
 
 
 @dataclass
 class Erc20Contract:
-    abi: list = open("./abi/erc_20.json", "r").read()
\ No newline at end of file
+    abi: list = field(default_factory=lambda: ERC20_ABI)
@@ -1,36 +1,39 @@
 import asyncio
 import random
+import signal
 import sys
 import os
 from typing import Callable, Dict
 
 from loguru import logger
+from core.auth import auth_tokens
 from core.bot import SomniaBot  
-from loader import config, semaphore, progress
+from core.api import BaseAPIClient
+from core.rpc import close_transports, endpoint_pools, rpc_sessions
+from core.signer import signatures
+from loader import config, semaphore, progress, state, throughput
 from models import Account
-from utils import setup
+from utils import setup, keypairs, open_handles, running_tasks
 from console import Console
 
 
-def get_address(mnemonic):
-    from eth_account import Account
-    account = Account()
-    keypair = account.from_mnemonic(mnemonic) if len(mnemonic.split()) in (12, 24) else account.from_key(mnemonic)
-    return keypair.address
+def get_address(account: Account) -> str:
+    return account.address or keypairs.address(account.pk_or_mnemonic)
 
 async def process_execution(account: Account, process_func):
-    address = get_address(account.pk_or_mnemonic)
-    async with semaphore:
-        try:
-            min_delay = config.delay_before_start.min
-            max_delay = config.delay_before_start.max
+    address = get_address(account)
+
+    min_delay = config.delay_before_start.min
+    max_delay = config.delay_before_start.max
 
-            if isinstance(min_delay, (int, float)) and isinstance(max_delay, (int, float)):
-                if 0 < min_delay <= max_delay and max_delay > 0:
-                    delay = random.uniform(min_delay, max_delay)
-                    logger.info(f"🔄 Account: {address} | Applying initial delay of {delay:.2f} seconds")
-                    await asyncio.sleep(delay)
+    if isinstance(min_delay, (int, float)) and isinstance(max_delay, (int, float)):
+        if 0 < min_delay <= max_delay and max_delay > 0:
+            delay = random.uniform(min_delay, max_delay)
+            logger.info(f"🔄 Account: {address} | Applying initial delay of {delay:.2f} seconds")
+            await asyncio.sleep(delay)
 
+    async with semaphore.slot():
+        try:
             status, result = await process_func(account)
             if status:
                 progress.increment()
@@ -39,6 +42,78 @@ async def process_execution(account: Account, process_func):
         except Exception as e:
             logger.error(f"❌ Account: {address} | Error during execution: {str(e)}")
 
+async def run_worker_pool(process_func, workers: int) -> None:
+    queue: asyncio.Queue[Account | None] = asyncio.Queue(maxsize=workers)
+
+    async def worker() -> None:
+        while (account := await queue.get()) is not None:
+            await process_execution(account, process_func)
+
+    consumers = [asyncio.create_task(worker()) for _ in range(workers)]
+    try:
+        for account in config.accounts:
+            await queue.put(account)
+        for _ in consumers:
+            await queue.put(None)
+        await asyncio.gather(*consumers)
+    finally:
+        for consumer in consumers:
+            consumer.cancel()
+
+async def execute_module(process_func) -> None:
+    if config.module == "recruiting_referrals":
+        account = config.accounts[0]
+        await process_execution(account, process_func)
+        logger.info(f"🔄 Accounts processed: 1/1")
+    elif config.module == "portfolio_scan":
+        await process_func(config.accounts)
+    elif config.pipeline_workers > 0:
+        await run_worker_pool(process_func, config.pipeline_workers)
+    else:
+        tasks = [
+            asyncio.create_task(process_execution(account, process_func))
+            for account in config.accounts
+        ]
+        await asyncio.gather(*tasks)
+
+def log_resource_report() -> None:
+    descriptors, sockets = open_handles()
+    report = (
+        f"API sessions: {BaseAPIClient.open_sessions} | RPC connections: {rpc_sessions.open_connections} | "
+        f"Tasks: {running_tasks()} | File descriptors: {descriptors if descriptors is not None else 'n/a'} | "
+        f"Sockets: {sockets if sockets is not None else 'n/a'}"
+    )
+    if BaseAPIClient.open_sessions:
+        logger.warning(f"🧹 Resources left open | {report}")
+    else:
+        logger.info(f"🧹 Resources | {report}")
+
+async def run_interruptible(coro) -> None:
+    loop = asyncio.get_running_loop()
+    task = asyncio.create_task(coro)
+    signals = (signal.SIGINT, signal.SIGTERM)
+
+    for sig in signals:
+        try:
+            loop.add_signal_handler(sig, task.cancel)
+        except (NotImplementedError, RuntimeError):
+            pass
+
+    try:
+        await task
+    except asyncio.CancelledError:
+        state.close()
+        signatures.save()
+        auth_tokens.save()
+        logger.warning("⛔ Run interrupted | Completed steps are saved, the next run resumes from the first unfinished step")
+        sys.exit(1)
+    finally:
+        for sig in signals:
+            try:
+                loop.remove_signal_handler(sig)
+            except (NotImplementedError, RuntimeError):
+                pass
+
 async def main_loop() -> None:
     while True:
         console = Console()
@@ -56,32 +131,51 @@ async def main_loop() -> None:
             process_func = module_functions.get(config.module)
             if process_func:
                 try:
-                    if config.module == "recruiting_referrals":
-                        account = config.accounts[0]
-                        await process_execution(account, process_func)
-                        logger.info(f"🔄 Accounts processed: 1/1")
-                    else:
-                        tasks = [
-                            asyncio.create_task(process_execution(account, process_func))
-                            for account in config.accounts
-                        ]
-                        await asyncio.gather(*tasks)
+                    await run_interruptible(execute_module(process_func))
                 except Exception as e:
-                    address = get_address(config.accounts[0].pk_or_mnemonic)
+                    address = get_address(config.accounts[0])
                     logger.error(f"❌ Account: {address} | Error during execution: {str(e)}")
             else:
-                address = get_address(config.accounts[0].pk_or_mnemonic)
+                address = get_address(config.accounts[0])
                 logger.warning(f"❌ Account: {address} | Module {config.module} not implemented yet!")
 
+            if rpc_sessions.stats.requests:
+                logger.info(f"🔌 RPC transport | {rpc_sessions.stats}")
+                for pool in endpoint_pools.values():
+                    for endpoint in pool.endpoints:
+                        logger.info(f"🔌 RPC endpoint | {endpoint}")
+
+            signatures.save()
+            auth_tokens.save()
+
+            if throughput.submitted:
+                logger.info(f"📈 Transactions | {throughput}")
+                throughput.reset()
+
+            log_resource_report()
+
             progress.processed = 0
             
             input("\nPress Enter to continue...")
             os.system("cls" if os.name == "nt" else "clear")
 
+async def main() -> None:
+    try:
+        await main_loop()
+    finally:
+        await close_transports()
+
 
 if __name__ == "__main__":
     if sys.platform == "win32":
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
     setup()
-    asyncio.run(main_loop())
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        logger.warning("⛔ Run interrupted | Completed steps are saved, the next run resumes from the first unfinished step")
+    finally:
+        state.close()
+        signatures.save()
+        auth_tokens.save()
\ No newline at end of file
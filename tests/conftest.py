@@ -0,0 +1,40 @@
+import asyncio
+
+
+class FakeProvider:
+    """Answers JSON-RPC batches from a ``{method: result}`` table and records every batch.
+
+    A result that is an ``Exception`` becomes an error response, a callable is
+    called with the params.
+    """
+
+    def __init__(self, results: dict, endpoint_uri: str = "http://fake-rpc", delay: float = 0):
+        self.results = results
+        self.endpoint_uri = endpoint_uri
+        self.delay = delay
+        self.batches: list[list[tuple[str, list]]] = []
+        self.requests: list[tuple[str, list]] = []
+
+    async def make_request(self, method: str, params: list) -> dict:
+        self.requests.append((method, params))
+        (response,) = await self._respond([(method, params)])
+        return response
+
+    async def make_batch_request(self, calls: list[tuple[str, list]]) -> list[dict]:
+        self.batches.append(calls)
+        return await self._respond(calls)
+
+    async def _respond(self, calls: list[tuple[str, list]]) -> list[dict]:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        responses = []
+        for request_id, (method, params) in enumerate(calls):
+            result = self.results[method]
+            if callable(result):
+                result = result(params)
+            if isinstance(result, Exception):
+                responses.append({"id": request_id, "error": {"code": -32000, "message": str(result)}})
+            else:
+                responses.append({"id": request_id, "result": result})
+        return responses
@@ -0,0 +1,38 @@
+from web3.providers import AsyncHTTPProvider
+
+from core.contracts import abi as abi_module
+from core.contracts.abi import AbiRegistry
+from models import ERC20_ABI, Erc20Contract
+
+TOKEN = "0x1111111111111111111111111111111111111111"
+
+
+def test_contracts_are_cached_without_reserializing_the_abi(monkeypatch):
+    registry = AbiRegistry()
+    registry.register("erc_20", ERC20_ABI)
+    provider = AsyncHTTPProvider("http://127.0.0.1:8545")
+    custom_abi = [entry for entry in ERC20_ABI if entry.get("name") != "approve"]
+
+    dumps = []
+    real_dumps = abi_module.json.dumps
+    monkeypatch.setattr(abi_module.json, "dumps", lambda *args, **kwargs: dumps.append(args) or real_dumps(*args, **kwargs))
+
+    first = registry.contract_for_abi(provider, TOKEN, custom_abi)
+    for _ in range(5):
+        assert registry.contract_for_abi(provider, TOKEN, custom_abi) is first
+    assert len(dumps) == 1
+
+    by_name = registry.contract(provider, TOKEN, "erc_20")
+    assert registry.contract_for_abi(provider, TOKEN, Erc20Contract().abi) is by_name
+    assert len(dumps) == 1
+    assert by_name is not first
+
+
+def test_selectors_match_the_abi():
+    registry = AbiRegistry()
+    registry.register("erc_20", ERC20_ABI)
+
+    selectors = registry.selectors("erc_20")
+
+    assert selectors["balanceOf"] == "0x70a08231"
+    assert selectors["approve"] == "0x095ea7b3"
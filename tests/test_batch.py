@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+import pytest
+
+from core.exceptions.base import RPCError
+from core.rpc.batch import RPCBatch
+from core.rpc.transport import PooledHTTPProvider
+
+from .conftest import FakeProvider
+
+
+def provider() -> FakeProvider:
+    return FakeProvider({
+        "eth_blockNumber": hex(100),
+        "eth_getBlockByNumber": {"number": hex(100)},
+        "eth_getTransactionReceipt": None,
+        "eth_call": ValueError("execution reverted"),
+    })
+
+
+def test_results_keep_call_order_and_formatters():
+    batch = RPCBatch(provider())
+    block_index = batch.add("eth_getBlockByNumber", ["latest", False], formatter=None)
+    number_index = batch.add("eth_blockNumber", [])
+    receipt_index = batch.add("eth_getTransactionReceipt", ["0x" + "00" * 32], formatter=None)
+
+    results = asyncio.run(batch.execute())
+
+    assert (block_index, number_index, receipt_index) == (0, 1, 2)
+    assert results == [{"number": hex(100)}, 100, None]
+    assert len(batch.provider.batches) == 1
+
+
+def test_errors_raise_rpc_error_naming_the_method():
+    batch = RPCBatch(provider())
+    batch.add("eth_blockNumber", [])
+    batch.add("eth_call", [{"to": "0x0000000000000000000000000000000000000001", "data": "0x"}, "latest"])
+
+    with pytest.raises(RPCError) as error:
+        asyncio.run(batch.execute())
+
+    assert error.value.method == "eth_call"
+    assert "execution reverted" in str(error.value)
+    assert isinstance(error.value, ValueError)
+
+
+def test_errors_become_none_when_not_raised():
+    batch = RPCBatch(provider())
+    batch.add("eth_call", [{"to": "0x0000000000000000000000000000000000000001", "data": "0x"}, "latest"])
+    batch.add("eth_blockNumber", [])
+
+    assert asyncio.run(batch.execute(raise_on_error=False)) == [None, 100]
+
+
+def test_empty_batch_sends_nothing():
+    batch = RPCBatch(provider())
+
+    assert asyncio.run(batch.execute()) == []
+    assert batch.provider.batches == []
+
+
+class ScriptedHTTPProvider(PooledHTTPProvider):
+    """Answers every batch with a canned body built from the request payload."""
+
+    def __init__(self, respond):
+        super().__init__("http://scripted-rpc")
+        self.respond = respond
+
+    async def _post(self, data: bytes, methods: list[str]) -> bytes:
+        return json.dumps(self.respond(json.loads(data))).encode()
+
+
+def test_http_batches_are_matched_by_id_not_position():
+    def respond(payload):
+        first, second, third = payload
+        # Out of order, and the third response is missing entirely
+        return [
+            {"jsonrpc": "2.0", "id": second["id"], "result": hex(2)},
+            {"jsonrpc": "2.0", "id": first["id"], "result": hex(1)},
+        ]
+
+    batch = RPCBatch(ScriptedHTTPProvider(respond))
+    for _ in range(3):
+        batch.add("eth_blockNumber", [])
+
+    assert asyncio.run(batch.execute(raise_on_error=False)) == [1, 2, None]
+
+
+def test_http_batch_rejected_as_a_whole_raises():
+    batch = RPCBatch(ScriptedHTTPProvider(lambda payload: {"jsonrpc": "2.0", "id": None, "error": {"message": "batch too large"}}))
+    batch.add("eth_blockNumber", [])
+
+    with pytest.raises(RPCError, match="batch too large"):
+        asyncio.run(batch.execute())
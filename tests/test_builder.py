@@ -0,0 +1,161 @@
+import asyncio
+import itertools
+
+import pytest
+
+from core.rpc.builder import TRANSFER_GAS, FeePolicy, GasEstimateCache, TransactionBuilder
+from core.rpc.gas import FeeQuote
+
+from .conftest import FakeProvider
+
+GWEI = 10 ** 9
+SENDER = "0x0000000000000000000000000000000000000001"
+CONTRACT = "0x1111111111111111111111111111111111111111"
+APPROVE = "0x095ea7b3" + "00" * 64
+
+_endpoints = itertools.count()
+
+
+def builder_for(estimate: int = 50_000) -> TransactionBuilder:
+    provider = FakeProvider({
+        "eth_chainId": hex(50312),
+        "eth_estimateGas": hex(estimate),
+        "eth_gasPrice": hex(6 * GWEI),
+        "eth_getBlockByNumber": {"number": hex(1), "baseFeePerGas": None},
+        "eth_maxPriorityFeePerGas": hex(GWEI),
+    }, endpoint_uri=f"http://builder-{next(_endpoints)}")
+    return TransactionBuilder(provider, GasEstimateCache(), FeePolicy(), gas_limit_multiplier=1.5)
+
+
+def estimate_calls(builder: TransactionBuilder) -> list[list]:
+    return [params for batch in builder.provider.batches for method, params in batch if method == "eth_estimateGas"]
+
+
+def test_contract_calls_are_estimated_for_every_sender():
+    builder = builder_for(estimate=40_000)
+
+    async def main():
+        return [await builder.build(SENDER, CONTRACT, APPROVE) for _ in range(2)]
+
+    transactions = asyncio.run(main())
+
+    assert [transaction["gas"] for transaction in transactions] == [60_000, 60_000]
+    assert len(estimate_calls(builder)) == 2
+    assert estimate_calls(builder)[0][0]["from"] == SENDER
+    assert transactions[0]["chainId"] == 50312
+    assert transactions[0]["gasPrice"] == 6 * GWEI
+
+
+def test_reuse_estimate_skips_the_node_once_known():
+    builder = builder_for(estimate=40_000)
+
+    async def main():
+        first = await builder.build(SENDER, CONTRACT, APPROVE, reuse_estimate=True)
+        second = await builder.build(SENDER, CONTRACT, APPROVE, reuse_estimate=True)
+        builder.estimates.forget(CONTRACT, APPROVE)
+        await builder.build(SENDER, CONTRACT, APPROVE, reuse_estimate=True)
+        return first, second
+
+    first, second = asyncio.run(main())
+
+    assert first["gas"] == second["gas"] == 60_000
+    assert len(estimate_calls(builder)) == 2
+
+
+def test_plain_transfers_use_the_static_limit():
+    builder = builder_for()
+
+    transaction = asyncio.run(builder.build(SENDER, CONTRACT, value=1))
+
+    assert transaction["gas"] == TRANSFER_GAS
+    assert "data" not in transaction
+    assert estimate_calls(builder) == []
+
+
+def test_estimate_cache_keeps_the_highest_estimate_per_selector():
+    estimates = GasEstimateCache()
+    estimates.record(CONTRACT, APPROVE, 45_000)
+    estimates.record(CONTRACT.upper().replace("0X", "0x"), "0x095ea7b3" + "ff" * 64, 30_000)
+
+    assert estimates.get(CONTRACT, APPROVE) == 45_000
+    estimates.forget(CONTRACT, APPROVE)
+    assert estimates.get(CONTRACT, APPROVE) is None
+
+
+def quote(gas_price: int, base_fee: int | None, suggested_tip: int | None = None) -> FeeQuote:
+    return FeeQuote(gas_price, base_fee, block_number=1, fetched_at=0, suggested_tip=suggested_tip)
+
+
+def test_eip1559_fees_follow_the_node_tip():
+    policy = FeePolicy(mode="auto")
+
+    assert policy.fee_params(quote(6 * GWEI, 5 * GWEI, suggested_tip=GWEI // 10)) == {
+        "maxPriorityFeePerGas": GWEI // 10,
+        "maxFeePerGas": 10 * GWEI + GWEI // 10,
+    }
+    # Without eth_maxPriorityFeePerGas the tip is what the gas price adds over the base fee
+    assert policy.fee_params(quote(6 * GWEI, 5 * GWEI))["maxPriorityFeePerGas"] == GWEI
+    assert policy.fee_params(quote(6 * GWEI, None)) == {"gasPrice": 6 * GWEI}
+
+
+def test_min_priority_fee_only_raises_lower_tips():
+    policy = FeePolicy(mode="eip1559", min_priority_fee_gwei=0.5)
+
+    assert policy.fee_params(quote(5 * GWEI, 5 * GWEI, suggested_tip=0)) == {
+        "maxPriorityFeePerGas": GWEI // 2,
+        "maxFeePerGas": 10 * GWEI + GWEI // 2,
+    }
+    assert policy.fee_params(quote(5 * GWEI, 5 * GWEI, suggested_tip=2 * GWEI))["maxPriorityFeePerGas"] == 2 * GWEI
+
+
+def test_legacy_replacements_step_up_until_the_cap():
+    policy = FeePolicy(mode="legacy", max_multiplier=2.0)
+    network = quote(10 * GWEI, None)
+    previous = policy.fee_params(network)
+
+    prices = []
+    while (fees := policy.replacement_params(previous, network)) is not None:
+        assert fees["gasPrice"] >= previous["gasPrice"] * 1.125
+        prices.append(fees["gasPrice"])
+        previous = fees
+
+    assert len(prices) == 5
+    assert prices[-1] <= 20 * GWEI
+
+
+def test_replacements_follow_a_rising_network_price():
+    policy = FeePolicy(mode="legacy", max_multiplier=2.0)
+
+    fees = policy.replacement_params({"gasPrice": 10 * GWEI}, quote(15 * GWEI, None))
+
+    assert fees == {"gasPrice": 15 * GWEI}
+
+
+def test_zero_tip_replacements_are_capped_by_the_fee_per_gas():
+    policy = FeePolicy(mode="eip1559", max_multiplier=2.0)
+    network = quote(6 * GWEI, 6 * GWEI, suggested_tip=0)
+    previous = policy.fee_params(network)
+    assert previous["maxPriorityFeePerGas"] == 0
+
+    replacements = 0
+    while (fees := policy.replacement_params(previous, network)) is not None:
+        assert fees["maxPriorityFeePerGas"] > previous["maxPriorityFeePerGas"]
+        assert fees["maxFeePerGas"] > previous["maxFeePerGas"]
+        assert fees["maxFeePerGas"] <= 24 * GWEI
+        previous = fees
+        replacements += 1
+
+    assert replacements == 5
+
+
+def test_replacements_respect_max_fee_gwei():
+    policy = FeePolicy(mode="legacy", max_multiplier=3.0, max_fee_gwei=11)
+
+    assert policy.replacement_params({"gasPrice": 10 * GWEI}, quote(10 * GWEI, None)) is None
+
+
+def test_eip1559_replacement_without_base_fee_raises():
+    policy = FeePolicy(mode="eip1559")
+
+    with pytest.raises(ValueError):
+        policy.replacement_params({"maxFeePerGas": GWEI, "maxPriorityFeePerGas": 0}, quote(GWEI, None))
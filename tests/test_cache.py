@@ -0,0 +1,145 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from core.auth import AuthTokenCache
+from core.signer import SignatureCache
+from utils import KeypairCache, SingleFlight
+
+ADDRESS = "0x0000000000000000000000000000000000000001"
+PRIVATE_KEY = "0x" + "11" * 32
+
+
+def test_single_flight_shares_one_call_per_key():
+    flights = SingleFlight()
+    calls = []
+
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key * 2
+
+    async def main():
+        results = await asyncio.gather(*(flights.run(key, lambda key=key: fetch(key)) for key in (1, 1, 2, 1)))
+        again = await flights.run(1, lambda: fetch(1))
+        return results, again
+
+    results, again = asyncio.run(main())
+
+    assert results == [2, 2, 4, 2]
+    assert again == 2
+    assert calls == [1, 2, 1]
+
+
+def test_single_flight_shares_errors_and_survives_cancelled_callers():
+    flights = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("node down")
+
+    async def slow():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def main():
+        errors = await asyncio.gather(flights.run("a", fail), flights.run("a", fail), return_exceptions=True)
+
+        impatient = asyncio.ensure_future(flights.run("b", slow))
+        await asyncio.sleep(0)
+        impatient.cancel()
+        return errors, await flights.run("b", slow)
+
+    errors, result = asyncio.run(main())
+
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert result == "done"
+
+
+def test_signature_cache_round_trip(tmp_path):
+    path = tmp_path / "signatures.json"
+    cache = SignatureCache()
+    cache.load(path)
+    cache.put(ADDRESS, "hello", "0xsig")
+    cache.save()
+
+    reloaded = SignatureCache()
+    reloaded.load(path)
+
+    assert reloaded.get(ADDRESS.upper(), "hello") == "0xsig"
+    assert reloaded.get(ADDRESS, "other") is None
+
+
+def test_unchanged_caches_are_not_written(tmp_path):
+    path = tmp_path / "signatures.json"
+    cache = SignatureCache()
+    cache.put(ADDRESS, "hello", "0xsig")
+    cache.save()
+    assert not path.exists()
+
+    cache.load(path)
+    cache.save()
+    assert not path.exists()
+
+
+@pytest.mark.parametrize("content", ["{not json", "[1, 2, 3]", '{"key": 5}'])
+def test_unreadable_auth_cache_is_rebuilt(tmp_path, content):
+    path = tmp_path / "auth_tokens.json"
+    path.write_text(content, encoding="utf-8")
+
+    cache = AuthTokenCache()
+    cache.load(path)
+
+    assert cache.get(ADDRESS) is None
+    cache.put(ADDRESS, "token")
+    cache.save()
+    assert list(json.loads(path.read_text(encoding="utf-8"))) == [ADDRESS.lower()]
+
+
+def test_expired_auth_tokens_are_dropped_on_load(tmp_path):
+    path = tmp_path / "auth_tokens.json"
+    path.write_text(json.dumps({
+        ADDRESS.lower(): ["fresh", time.time() + 3600],
+        "0x0000000000000000000000000000000000000002": ["stale", time.time() - 1],
+    }), encoding="utf-8")
+
+    cache = AuthTokenCache()
+    cache.load(path)
+
+    assert cache.get(ADDRESS) == "fresh"
+    assert cache.get("0x0000000000000000000000000000000000000002") is None
+
+
+def test_concurrent_logins_share_one_request():
+    cache = AuthTokenCache()
+    logins = []
+
+    async def login():
+        logins.append(1)
+        await asyncio.sleep(0.01)
+        return "token"
+
+    async def main():
+        return await asyncio.gather(*(cache.token(ADDRESS, login) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["token"] * 5
+    assert len(logins) == 1
+    assert cache.get(ADDRESS) == "token"
+
+
+def test_address_index_skips_derivation_after_restart(tmp_path):
+    path = tmp_path / "address_index.json"
+    keypairs = KeypairCache()
+    keypairs.load_index(path)
+    address = keypairs.address(PRIVATE_KEY)
+    keypairs.save_index()
+
+    assert PRIVATE_KEY not in path.read_text(encoding="utf-8")
+
+    restarted = KeypairCache()
+    restarted.load_index(path)
+    assert restarted.is_known(PRIVATE_KEY)
+    assert restarted.address(PRIVATE_KEY) == address
+    assert restarted._keypairs == {}
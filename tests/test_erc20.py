@@ -0,0 +1,44 @@
+import pytest
+from web3 import Web3
+
+from core.contracts import erc20
+from models import ERC20_ABI
+
+OWNER = "0x1111111111111111111111111111111111111111"
+SPENDER = "0xAbCdEf0123456789aBcDeF0123456789AbCdEf01"
+
+
+@pytest.fixture(scope="module")
+def contract():
+    return Web3().eth.contract(address=Web3.to_checksum_address(OWNER), abi=ERC20_ABI)
+
+
+@pytest.mark.parametrize("function, args, encoded", [
+    ("balanceOf", [OWNER], lambda: erc20.balance_of(OWNER)),
+    ("allowance", [OWNER, SPENDER], lambda: erc20.allowance(OWNER, SPENDER)),
+    ("approve", [SPENDER, 2 ** 256 - 1], lambda: erc20.approve(SPENDER, 2 ** 256 - 1)),
+    ("transfer", [SPENDER, 10 ** 18], lambda: erc20.transfer(SPENDER, 10 ** 18)),
+    ("decimals", [], erc20.decimals),
+])
+def test_calldata_matches_web3(contract, function, args, encoded):
+    checksummed = [Web3.to_checksum_address(arg) if isinstance(arg, str) else arg for arg in args]
+
+    assert encoded() == contract.encode_abi(fn_name=function, args=checksummed)
+
+
+@pytest.mark.parametrize("address", ["0x1234", "1111111111111111111111111111111111111111xx", "0x" + "g" * 40])
+def test_invalid_addresses_are_rejected(address):
+    with pytest.raises(ValueError):
+        erc20.balance_of(address)
+
+
+@pytest.mark.parametrize("amount", [-1, 2 ** 256])
+def test_out_of_range_amounts_are_rejected(amount):
+    with pytest.raises(ValueError):
+        erc20.transfer(OWNER, amount)
+
+
+def test_decode_uint():
+    assert erc20.decode_uint("0x" + format(18, "064x") + "00" * 32) == 18
+    with pytest.raises(ValueError):
+        erc20.decode_uint("0x")
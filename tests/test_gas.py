@@ -0,0 +1,66 @@
+import asyncio
+
+from core.rpc.gas import GasOracle
+
+from .conftest import FakeProvider
+
+GWEI = 10 ** 9
+
+
+def fee_provider(**overrides) -> FakeProvider:
+    results = {
+        "eth_gasPrice": hex(6 * GWEI),
+        "eth_getBlockByNumber": {"number": hex(100), "baseFeePerGas": hex(5 * GWEI)},
+        "eth_maxPriorityFeePerGas": hex(GWEI),
+    }
+    results.update(overrides)
+    return FakeProvider(results, delay=0.01)
+
+
+def test_concurrent_quotes_share_one_batch():
+    provider = fee_provider()
+    oracle = GasOracle(provider)
+
+    async def main():
+        return await asyncio.gather(*(oracle.quote() for _ in range(20)))
+
+    quotes = asyncio.run(main())
+
+    assert len(provider.batches) == 1
+    assert all(quote is quotes[0] for quote in quotes)
+    assert quotes[0].gas_price == 6 * GWEI
+    assert quotes[0].base_fee == 5 * GWEI
+    assert quotes[0].block_number == 100
+
+
+def test_quote_is_refetched_after_new_blocks():
+    provider = fee_provider()
+    oracle = GasOracle(provider, ttl_blocks=5, block_time=60)
+
+    async def main():
+        await oracle.quote()
+        oracle.on_block(104)
+        await oracle.quote()
+        oracle.on_block(105)
+        await oracle.quote()
+
+    asyncio.run(main())
+
+    assert len(provider.batches) == 2
+
+
+def test_tip_falls_back_when_the_node_has_no_suggestion():
+    provider = fee_provider(eth_maxPriorityFeePerGas=ValueError("the method does not exist"))
+
+    quote = asyncio.run(GasOracle(provider).quote())
+
+    assert quote.suggested_tip is None
+    assert quote.priority_fee == GWEI
+
+
+def test_suggested_tip_is_used_as_is():
+    provider = fee_provider(eth_maxPriorityFeePerGas=hex(0))
+
+    quote = asyncio.run(GasOracle(provider).quote())
+
+    assert quote.priority_fee == 0
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from core.rpc.nonce import NonceManager, is_already_known, is_nonce_error
+
+from .conftest import FakeProvider
+
+ADDRESS = "0x0000000000000000000000000000000000000001"
+
+
+def manager(pending: int = 7) -> tuple[NonceManager, FakeProvider]:
+    provider = FakeProvider({"eth_getTransactionCount": hex(pending)})
+    return NonceManager(provider, ADDRESS), provider
+
+
+def test_reserve_asks_the_node_once_then_counts_locally():
+    nonces, provider = manager(pending=7)
+
+    async def main():
+        return [await nonces.reserve() for _ in range(3)]
+
+    assert asyncio.run(main()) == [7, 8, 9]
+    assert provider.requests == [("eth_getTransactionCount", [ADDRESS, "pending"])]
+
+
+def test_concurrent_reservations_are_unique():
+    nonces, _ = manager(pending=0)
+
+    async def main():
+        return await asyncio.gather(*(nonces.reserve() for _ in range(50)))
+
+    assert sorted(asyncio.run(main())) == list(range(50))
+
+
+def test_release_only_rewinds_the_latest_nonce():
+    nonces, _ = manager(pending=3)
+
+    async def main():
+        first, second = await nonces.reserve(), await nonces.reserve()
+        nonces.release(first)
+        after_stale_release = await nonces.reserve()
+        nonces.release(after_stale_release)
+        return second, after_stale_release, await nonces.reserve()
+
+    assert asyncio.run(main()) == (4, 5, 5)
+
+
+def test_resync_and_invalidate_go_back_to_the_node():
+    nonces, provider = manager(pending=1)
+
+    async def main():
+        await nonces.reserve()
+        await nonces.reserve()
+        provider.results["eth_getTransactionCount"] = hex(2)
+        await nonces.resync()
+        resynced = await nonces.reserve()
+        provider.results["eth_getTransactionCount"] = hex(10)
+        nonces.invalidate()
+        return resynced, await nonces.reserve()
+
+    assert asyncio.run(main()) == (2, 10)
+    assert len(provider.requests) == 3
+
+
+def test_fetch_errors_are_raised():
+    provider = FakeProvider({"eth_getTransactionCount": ValueError("header not found")})
+    nonces = NonceManager(provider, ADDRESS)
+
+    with pytest.raises(ValueError):
+        asyncio.run(nonces.reserve())
+
+
+@pytest.mark.parametrize("message, nonce_error, already_known", [
+    ("nonce too low: next nonce 5, tx nonce 4", True, False),
+    ("Invalid nonce", True, False),
+    ("already known", False, True),
+    ("known transaction: 0xabc", False, True),
+    ("insufficient funds for gas * price + value", False, False),
+])
+def test_send_error_classification(message, nonce_error, already_known):
+    error = ValueError({"code": -32000, "message": message})
+
+    assert is_nonce_error(error) is nonce_error
+    assert is_already_known(error) is already_known
@@ -0,0 +1,73 @@
+import asyncio
+import time
+
+import pytest
+
+from core.rpc.receipts import ReceiptTracker
+
+from .conftest import FakeProvider
+
+MINED = "0x" + "11" * 32
+PENDING = "0x" + "22" * 32
+
+
+def receipt(status: int = 1) -> dict:
+    return {"status": hex(status), "blockNumber": hex(42), "gasUsed": hex(21_000)}
+
+
+def tracker_for(receipts: dict) -> ReceiptTracker:
+    blocks = iter(range(100, 10_000))
+    provider = FakeProvider({
+        "eth_blockNumber": lambda params: hex(next(blocks)),
+        "eth_getTransactionReceipt": lambda params: receipts.get(params[0]),
+    })
+    return ReceiptTracker(provider, poll_interval=0.01, timeout=5)
+
+
+def test_receipts_resolve_with_decoded_fields():
+    tracker = tracker_for({MINED: receipt(status=0)})
+
+    async def main():
+        return await asyncio.wait_for(tracker.watch(MINED), 1)
+
+    result = asyncio.run(main())
+
+    assert result["status"] == 0
+    assert result["blockNumber"] == 42
+    assert tracker.provider.batches[1] == [("eth_getTransactionReceipt", [MINED])]
+
+
+def test_unmined_transactions_time_out():
+    tracker = tracker_for({})
+
+    async def main():
+        return await asyncio.wait_for(tracker.watch(PENDING, time.monotonic() + 0.05), 1)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(main())
+
+
+def test_forget_while_receipts_are_in_flight():
+    receipts = {}
+
+    def get_receipt(params):
+        # forget() runs while the receipt batch is awaited
+        tracker.forget(PENDING)
+        return receipts.get(params[0], receipt())
+
+    tracker = tracker_for(receipts)
+    tracker.provider.results["eth_getTransactionReceipt"] = get_receipt
+
+    async def main():
+        forgotten = tracker.watch(PENDING)
+        mined = tracker.watch(MINED)
+        result = await asyncio.wait_for(mined, 1)
+        return forgotten, result
+
+    forgotten, result = asyncio.run(main())
+
+    assert forgotten.cancelled()
+    assert result["status"] == 1
+    # The rest of the batch is still settled in the same round
+    receipt_batches = [batch for batch in tracker.provider.batches if batch[0][0] == "eth_getTransactionReceipt"]
+    assert len(receipt_batches) == 1
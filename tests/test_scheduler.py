@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from utils.scheduler import WorkerSlots, cooldown
+
+
+def test_slots_bound_concurrent_work():
+    slots = WorkerSlots(2)
+    active, peak = 0, 0
+
+    async def work():
+        nonlocal active, peak
+        async with slots.slot():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    async def main():
+        await asyncio.gather(*(work() for _ in range(6)))
+
+    asyncio.run(main())
+
+    assert peak == 2
+    assert slots.available == 2
+
+
+def test_cooldown_hands_the_slot_to_a_waiter():
+    slots = WorkerSlots(1)
+    events = []
+
+    async def sleeper():
+        async with slots.slot():
+            events.append("sleeper starts")
+            await cooldown(0.05)
+            events.append("sleeper resumes")
+
+    async def other():
+        await asyncio.sleep(0.01)
+        async with slots.slot():
+            events.append("other runs")
+
+    async def main():
+        await asyncio.gather(sleeper(), other())
+
+    asyncio.run(main())
+
+    assert events == ["sleeper starts", "other runs", "sleeper resumes"]
+    assert slots.available == 1
+
+
+def test_resuming_accounts_are_served_before_fresh_ones():
+    slots = WorkerSlots(1)
+    order = []
+
+    async def main():
+        await slots.acquire()
+        fresh = asyncio.ensure_future(slots.acquire())
+        resuming = asyncio.ensure_future(slots.acquire(WorkerSlots.RESUMING))
+        await asyncio.sleep(0)
+
+        slots.release()
+        await asyncio.sleep(0)
+        order.append("resuming" if resuming.done() else "fresh")
+        slots.release()
+        await asyncio.gather(fresh, resuming)
+
+    asyncio.run(main())
+
+    assert order == ["resuming"]
+
+
+def test_cancelled_waiters_do_not_leak_slots():
+    slots = WorkerSlots(1)
+
+    async def main():
+        await slots.acquire()
+        waiter = asyncio.ensure_future(slots.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        slots.release()
+
+    asyncio.run(main())
+
+    assert slots.available == 1
+    assert slots.waiting == 0
+
+
+def test_cooldown_outside_a_slot_just_sleeps():
+    asyncio.run(cooldown(0))
+
+
+def test_at_least_one_slot_is_required():
+    with pytest.raises(ValueError):
+        WorkerSlots(0)
@@ -0,0 +1,45 @@
+import pytest
+
+from core.state import Checkpoints, StateStore
+
+ADDRESS = "0xAbC0000000000000000000000000000000000001"
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = StateStore(tmp_path / "state.db")
+    yield store
+    store.close()
+
+
+def test_steps_are_recorded_per_module_and_case_insensitive_address(store):
+    store.mark(ADDRESS, "profile", "username")
+
+    assert store.is_done(ADDRESS.lower(), "profile", "username")
+    assert not store.is_done(ADDRESS, "profile")
+    assert not store.is_done(ADDRESS, "faucet", "username")
+
+
+def test_ttl_expires_steps(store):
+    store.mark(ADDRESS, "faucet")
+
+    assert store.is_done(ADDRESS, "faucet", ttl=60)
+    assert not store.is_done(ADDRESS, "faucet", ttl=0)
+
+
+def test_checkpoints_resume_previous_steps(store):
+    Checkpoints(store, ADDRESS, "profile").mark("discord")
+
+    resumed = Checkpoints(store, ADDRESS, "profile")
+    assert resumed.done("discord")
+    assert not resumed.done("twitter")
+
+
+def test_checkpoints_without_resume_start_over_but_still_record(store):
+    Checkpoints(store, ADDRESS, "profile").mark("discord")
+
+    fresh = Checkpoints(store, ADDRESS, "profile", resume=False)
+    assert not fresh.done("discord")
+
+    fresh.mark("twitter")
+    assert Checkpoints(store, ADDRESS, "profile").done("twitter")
@@ -0,0 +1,72 @@
+import asyncio
+import json
+
+import pytest
+
+from core.contracts import TokenRegistry
+from core.contracts.erc20 import DECIMALS_SELECTOR
+
+from .conftest import FakeProvider
+
+TOKEN = "0x1111111111111111111111111111111111111111"
+EOA = "0x2222222222222222222222222222222222222222"
+
+
+def decimals_provider(delay: float = 0) -> FakeProvider:
+    def eth_call(params):
+        assert params[0]["data"] == DECIMALS_SELECTOR
+        return "0x" + format(6, "064x") if params[0]["to"].lower() == TOKEN else "0x"
+
+    return FakeProvider({"eth_call": eth_call}, delay=delay)
+
+
+def test_decimals_are_fetched_once_and_persisted(tmp_path):
+    registry = TokenRegistry()
+    registry.load(tmp_path / "tokens.json")
+    provider = decimals_provider(delay=0.01)
+
+    async def main():
+        return await asyncio.gather(*(registry.decimals(TOKEN, provider) for _ in range(10)))
+
+    assert asyncio.run(main()) == [6] * 10
+    assert len(provider.batches) == 1
+
+    reloaded = TokenRegistry()
+    reloaded.load(tmp_path / "tokens.json")
+    assert reloaded.get(TOKEN).decimals == 6
+
+
+def test_non_contract_address_is_not_an_erc20():
+    registry = TokenRegistry()
+
+    with pytest.raises(ValueError, match="not an ERC-20"):
+        asyncio.run(registry.decimals(EOA, decimals_provider()))
+    assert registry.get(EOA) is None
+
+
+def test_malformed_entries_are_skipped(tmp_path):
+    path = tmp_path / "tokens.json"
+    path.write_text(json.dumps([
+        {"address": TOKEN, "decimals": 18, "symbol": "USDT"},
+        {"address": EOA},
+        {"address": "not-an-address", "decimals": 18},
+        {"address": EOA, "decimals": "18"},
+        {"address": EOA, "decimals": 18, "unexpected": True},
+        "garbage",
+    ]), encoding="utf-8")
+
+    registry = TokenRegistry()
+    registry.load(path)
+
+    assert registry.get(TOKEN).decimals == 18
+    assert registry.get(EOA) is None
+
+
+def test_unreadable_file_is_rebuilt(tmp_path):
+    path = tmp_path / "tokens.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    registry = TokenRegistry()
+    registry.load(path)
+
+    assert registry.get(TOKEN) is None
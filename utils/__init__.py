@@ -1,6 +1,10 @@
 from .load_config import load_config
+from .keypairs import keypairs, KeypairCache
 from .console import *
 from .bot import *
 from .web3 import *
 from .generator import *
-from .smart_sleep import *
\ No newline at end of file
+from .scheduler import *
+from .smart_sleep import *
+from .resources import *
+from .cache import JsonCache, SingleFlight
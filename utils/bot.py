@@ -1,3 +1,5 @@
+import time
+
 
 class AccountProgress:
     def __init__(self, total_accounts: int = 0):
@@ -9,3 +11,37 @@ class AccountProgress:
 
     def reset(self):
         self.processed = 0
+
+
+class ThroughputMeter:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.started = None
+        self.submitted = 0
+        self.confirmed = 0
+        self.failed = 0
+
+    def record_submitted(self, count: int = 1):
+        if self.started is None:
+            self.started = time.monotonic()
+        self.submitted += count
+
+    def record_result(self, success: bool):
+        if success:
+            self.confirmed += 1
+        else:
+            self.failed += 1
+
+    @staticmethod
+    def per_minute(count: int, minutes: float) -> float:
+        return count / minutes if minutes else 0.0
+
+    def __str__(self) -> str:
+        minutes = max(time.monotonic() - self.started, 1e-9) / 60 if self.started is not None else 0
+        return (
+            f"{self.submitted} submitted ({self.per_minute(self.submitted, minutes):.1f}/min), "
+            f"{self.confirmed} confirmed ({self.per_minute(self.confirmed, minutes):.1f}/min), "
+            f"{self.failed} failed in {minutes:.2f} min"
+        )
@@ -0,0 +1,80 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+
+class JsonCache:
+    """In-memory cache that can be kept in a JSON file between runs.
+
+    Subclasses turn their entries into JSON data in ``_dump`` and back in
+    ``_restore``, and call ``_touch`` after every change. ``save`` only
+    writes when something changed since the last load or save; an
+    unreadable file is logged and rebuilt from scratch.
+    """
+    NAME = "Cache"
+    INDENT: int | None = None
+
+    def __init__(self):
+        self._path: Path | None = None
+        self._dirty = False
+
+    @property
+    def persistent(self) -> bool:
+        return self._path is not None
+
+    def load(self, path: Path | str) -> None:
+        self._path = Path(path)
+        if not self._path.exists():
+            return
+
+        try:
+            self._restore(json.loads(self._path.read_text(encoding="utf-8")))
+        except (AttributeError, OSError, TypeError, ValueError) as error:
+            logger.warning(f"{self.NAME} {self._path} is unreadable, rebuilding it: {error}")
+
+    def save(self) -> None:
+        if self._path is None or not self._dirty:
+            return
+
+        self._path.write_text(json.dumps(self._dump(), indent=self.INDENT), encoding="utf-8")
+        self._dirty = False
+
+    def _touch(self) -> None:
+        self._dirty = self._path is not None
+
+    def _dump(self) -> Any:
+        raise NotImplementedError
+
+    def _restore(self, data: Any) -> None:
+        raise NotImplementedError
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers share its result.
+
+    The shared call is shielded, so a cancelled caller does not cancel it for
+    the others, and the key is free again as soon as the call finishes.
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            # Retrieve the exception so it is not reported when every caller was cancelled
+            future.exception()
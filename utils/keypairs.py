@@ -0,0 +1,155 @@
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable
+
+from eth_account import Account as EthAccount
+from eth_account.signers.local import LocalAccount
+
+from .cache import JsonCache
+
+EthAccount.enable_unaudited_hdwallet_features()
+
+
+def is_mnemonic(pk_or_mnemonic: str) -> bool:
+    return len(pk_or_mnemonic.split()) in (12, 24)
+
+
+def derive_keypair(pk_or_mnemonic: str) -> LocalAccount:
+    if is_mnemonic(pk_or_mnemonic):
+        return EthAccount.from_mnemonic(pk_or_mnemonic)
+    return EthAccount.from_key(pk_or_mnemonic)
+
+
+def _derive_chunk(chunk: list[str]) -> list[tuple[bytes | None, str | None]]:
+    derived = []
+    for pk_or_mnemonic in chunk:
+        try:
+            keypair = derive_keypair(pk_or_mnemonic)
+        except Exception:
+            derived.append((None, None))
+        else:
+            derived.append((bytes(keypair.key), keypair.address))
+    return derived
+
+
+class AddressIndex(JsonCache):
+    """Wallet addresses keyed by a hash of the secret; only kept once ``load`` names a file."""
+    NAME = "Address index"
+    INDENT = 2
+
+    def __init__(self):
+        super().__init__()
+        self._addresses: dict[str, str] = {}
+
+    @staticmethod
+    def _fingerprint(pk_or_mnemonic: str) -> str:
+        return hashlib.sha256(pk_or_mnemonic.encode()).hexdigest()
+
+    def get(self, pk_or_mnemonic: str) -> str | None:
+        if not self.persistent:
+            return None
+        return self._addresses.get(self._fingerprint(pk_or_mnemonic))
+
+    def put(self, pk_or_mnemonic: str, address: str) -> None:
+        if not self.persistent:
+            return
+        fingerprint = self._fingerprint(pk_or_mnemonic)
+        if self._addresses.get(fingerprint) != address:
+            self._addresses[fingerprint] = address
+            self._touch()
+
+    def _dump(self) -> dict[str, str]:
+        return self._addresses
+
+    def _restore(self, data: dict) -> None:
+        self._addresses = {str(fingerprint): str(address) for fingerprint, address in data.items()}
+
+
+class KeypairCache:
+    """Derives each wallet's keypair at most once per process.
+
+    Addresses can additionally be kept in an on-disk index keyed by a hash of
+    the secret, so a restart resolves addresses without running BIP-39
+    derivation again. Keypairs themselves are only derived when something
+    actually has to sign.
+
+    ``warm`` fans derivation out over a process pool once there are enough
+    secrets left to derive; workers hand back raw private keys, which are
+    turned into ``LocalAccount`` objects on first use.
+    """
+    PARALLEL_THRESHOLD = 64
+
+    def __init__(self):
+        self._keypairs: dict[str, LocalAccount] = {}
+        self._private_keys: dict[str, bytes] = {}
+        self._addresses: dict[str, str] = {}
+        self._index = AddressIndex()
+
+    def load_index(self, path: Path) -> None:
+        self._index.load(path)
+
+    def save_index(self) -> None:
+        self._index.save()
+
+    def keypair(self, pk_or_mnemonic: str) -> LocalAccount:
+        keypair = self._keypairs.get(pk_or_mnemonic)
+        if keypair is None:
+            private_key = self._private_keys.pop(pk_or_mnemonic, None)
+            if private_key is not None:
+                keypair = EthAccount.from_key(private_key)
+            else:
+                keypair = derive_keypair(pk_or_mnemonic)
+            self._keypairs[pk_or_mnemonic] = keypair
+            self._remember_address(pk_or_mnemonic, keypair.address)
+        return keypair
+
+    def address(self, pk_or_mnemonic: str) -> str:
+        address = self._addresses.get(pk_or_mnemonic)
+        if address is not None:
+            return address
+
+        address = self._index.get(pk_or_mnemonic)
+        if address is not None:
+            self._addresses[pk_or_mnemonic] = address
+            return address
+
+        return self.keypair(pk_or_mnemonic).address
+
+    def is_known(self, pk_or_mnemonic: str) -> bool:
+        return pk_or_mnemonic in self._addresses or self._index.get(pk_or_mnemonic) is not None
+
+    def _remember_address(self, pk_or_mnemonic: str, address: str) -> None:
+        self._addresses[pk_or_mnemonic] = address
+        self._index.put(pk_or_mnemonic, address)
+
+    def warm(self, wallets: Iterable[str], workers: int = 0) -> None:
+        pending = [wallet for wallet in dict.fromkeys(wallets) if not self.is_known(wallet)]
+        workers = min(workers or os.cpu_count() or 1, len(pending))
+
+        if workers > 1 and len(pending) >= self.PARALLEL_THRESHOLD:
+            self._derive_parallel(pending, workers)
+        else:
+            for pk_or_mnemonic in pending:
+                try:
+                    self.keypair(pk_or_mnemonic)
+                except Exception:
+                    continue
+
+        self.save_index()
+
+    def _derive_parallel(self, pending: list[str], workers: int) -> None:
+        chunk_size = max(16, len(pending) // (workers * 8))
+        chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk, derived in zip(chunks, executor.map(_derive_chunk, chunks)):
+                for pk_or_mnemonic, (private_key, address) in zip(chunk, derived):
+                    if private_key is None:
+                        continue
+                    self._private_keys[pk_or_mnemonic] = private_key
+                    self._remember_address(pk_or_mnemonic, address)
+
+
+keypairs = KeypairCache()
@@ -9,6 +9,8 @@ from loguru import logger
 from better_proxy import Proxy
 
 from models import Account, Config
+from .keypairs import keypairs
+from .resources import is_main_process
 from sys import exit
 
 
@@ -84,11 +86,12 @@ class ConfigLoader:
             logger.error(f"Error parsing referral wallets: {e}")
             return []
 
-    def _get_accounts(self) -> Generator[Account, None, None]:
+    def _get_accounts(self, derivation_workers: int = 0) -> Generator[Account, None, None]:
         proxies = self._parse_proxies()
         proxy_cycle = cycle(proxies) if proxies else None
 
         wallets = self._read_file(self.data_path / "wallets.txt", allow_empty=False)
+        keypairs.warm(wallets, workers=derivation_workers)
         referral_private_keys = self._get_referral_private_keys()
 
         try:
@@ -122,24 +125,40 @@ class ConfigLoader:
 
         for i, wallet in enumerate(wallets):
             try:
-                auth_token = auth_tokens[i] if i < len(auth_tokens) else None
-                discord_token = discord_tokens[i] if i < len(discord_tokens) else None
-
-                yield Account(
-                    pk_or_mnemonic=wallet,
-                    proxy=next(proxy_cycle) if proxy_cycle else None,
-                    auth_token=auth_token,
-                    referral_codes=codes,
-                    referral_private_keys=referral_private_keys if referral_private_keys else None,
-                    token_discord=discord_token
-                )
-            except ValueError:
-                logger.error(f"Failed to parse account: {wallet}")
+                address = keypairs.address(wallet)
+            except Exception as e:
+                # The error message may echo the key or mnemonic, so only its type is logged
+                logger.error(f"Failed to parse wallet #{i + 1} in wallets.txt, skipping it: {type(e).__name__}")
+                continue
+
+            auth_token = auth_tokens[i] if i < len(auth_tokens) else None
+            discord_token = discord_tokens[i] if i < len(discord_tokens) else None
+
+            yield Account(
+                pk_or_mnemonic=wallet,
+                address=address,
+                proxy=next(proxy_cycle) if proxy_cycle else None,
+                auth_token=auth_token,
+                referral_codes=codes,
+                referral_private_keys=referral_private_keys if referral_private_keys else None,
+                token_discord=discord_token
+            )
 
     def load(self) -> Config | None:
         try:
             params = self._load_yaml()
-            accounts = list(self._get_accounts())
+            if params.get("rpc_transport") == "ws" and not params.get("somnia_ws"):
+                raise ConfigurationError("somnia_ws must be set when rpc_transport is ws")
+
+            if not is_main_process():
+                # Key derivation workers re-import the entry module when processes are spawned
+                return Config(**params)
+
+            if params.get("address_index"):
+                keypairs.load_index(self.data_path / "address_index.json")
+
+            accounts = list(self._get_accounts(params.get("derivation_workers", 0)))
+            keypairs.save_index()
             random.shuffle(accounts)
 
             return Config(
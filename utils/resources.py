@@ -0,0 +1,45 @@
+import asyncio
+import multiprocessing
+import os
+from pathlib import Path
+
+
+class AsyncClosable:
+    """``async with`` support for objects that release resources in ``close``."""
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+def open_handles() -> tuple[int | None, int | None]:
+    """Open file descriptors and sockets of this process (None where the platform does not tell)."""
+    fd_dir = Path("/proc/self/fd")
+    if not fd_dir.is_dir():
+        return None, None
+
+    descriptors = sockets = 0
+    for fd in fd_dir.iterdir():
+        try:
+            target = os.readlink(fd)
+        except OSError:
+            continue
+        descriptors += 1
+        if target.startswith("socket:"):
+            sockets += 1
+    return descriptors, sockets
+
+
+def running_tasks() -> int:
+    current = asyncio.current_task()
+    return sum(1 for task in asyncio.all_tasks() if task is not current and not task.done())
+
+
+def is_main_process() -> bool:
+    """False inside pool workers, including spawned ones that re-import ``__main__``."""
+    return multiprocessing.current_process().name == "MainProcess"
@@ -0,0 +1,91 @@
+import asyncio
+import heapq
+import itertools
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+class WorkerSlots:
+    """Semaphore limiting active work rather than wall-clock presence.
+
+    A holder that goes into a cooldown (see ``cooldown``) hands its slot to
+    the next waiter and queues for one again once its timer fires. Waiters
+    are kept in a heap: accounts coming back from a cooldown are served
+    before fresh ones, so started work finishes first.
+    """
+    RESUMING = 0
+    FRESH = 1
+
+    def __init__(self, value: int):
+        if value < 1:
+            raise ValueError("WorkerSlots value must be at least 1")
+        self._value = value
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    @property
+    def available(self) -> int:
+        return self._value
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    async def acquire(self, priority: int = FRESH) -> None:
+        if self._value > 0:
+            self._value -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._value += 1
+
+    @asynccontextmanager
+    async def slot(self):
+        await self.acquire()
+        lease = _Lease(self)
+        token = _current_lease.set(lease)
+        try:
+            yield lease
+        finally:
+            _current_lease.reset(token)
+            if lease.held:
+                lease.held = False
+                self.release()
+
+
+@dataclass
+class _Lease:
+    slots: WorkerSlots
+    held: bool = True
+
+
+_current_lease: ContextVar[_Lease | None] = ContextVar("worker_slot_lease", default=None)
+
+
+async def cooldown(delay: float) -> None:
+    """Sleep without occupying the caller's worker slot, if it holds one."""
+    lease = _current_lease.get()
+    if lease is None or not lease.held:
+        await asyncio.sleep(delay)
+        return
+
+    lease.held = False
+    lease.slots.release()
+    await asyncio.sleep(delay)
+    await lease.slots.acquire(WorkerSlots.RESUMING)
+    lease.held = True
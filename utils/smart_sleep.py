@@ -1,8 +1,9 @@
-import asyncio
 import random
 
 from loguru import logger
 
+from .scheduler import cooldown
+
 
 async def random_sleep(account_name: str = "Referral", min_sec: int = 30, max_sec: int = 60) -> None:
     delay = random.uniform(min_sec, max_sec)
@@ -14,4 +15,4 @@ async def random_sleep(account_name: str = "Referral", min_sec: int = 30, max_se
     else:
         logger.info(f"Account {account_name} | Sleep {seconds}s")
 
-    await asyncio.sleep(delay)
\ No newline at end of file
+    await cooldown(delay)